@@ -3,12 +3,46 @@
 This module is intentionally independent from `diagram_app` to avoid circular imports; it
 receives the `app` instance (DiagramApp) and reads/writes state on it.
 """
+import time
 import tkinter as tk
-from typing import Optional
-from math import hypot
+from typing import Dict, List, Optional, Tuple
 from models import ACTOR_WIDTH, ACTOR_HEIGHT, INTERACTION_START_Y, INTERACTION_V_GAP, CANVAS_HEIGHT
 from models import Actor
 
+# Width of the actor hit-testing buckets (keyed by x // GRID_CELL). An actor box is never
+# wider than a bucket, so a point can only hit actors in its own or a neighbouring bucket.
+GRID_CELL = ACTOR_WIDTH
+
+# Actor box half sizes and the y where lifelines end
+ACTOR_HALF_W = ACTOR_WIDTH // 2
+ACTOR_HALF_H = ACTOR_HEIGHT // 2
+LIFELINE_BOTTOM = CANVAS_HEIGHT - 20
+# (x0, y0, x1, y1) of an actor's box and of its selection outline relative to (actor.x, actor.y)
+ACTOR_BOX_OFFSETS = (-ACTOR_HALF_W, 0, ACTOR_HALF_W, ACTOR_HEIGHT)
+ACTOR_OUTLINE_MARGIN = 3
+ACTOR_OUTLINE_OFFSETS = (-ACTOR_HALF_W - ACTOR_OUTLINE_MARGIN, -ACTOR_OUTLINE_MARGIN,
+                         ACTOR_HALF_W + ACTOR_OUTLINE_MARGIN, ACTOR_HEIGHT + ACTOR_OUTLINE_MARGIN)
+
+# Minimum seconds between two processed drag positions (~60 Hz)
+DRAG_FRAME_INTERVAL = 1 / 60
+
+# Canvas item role tag -> {item option: (palette key, fallback)}; every drawn item carries
+# one of these tags so a palette change is a single itemconfigure per role (see recolor)
+ROLE_COLORS = {
+    'actor_box': {'fill': ('actor_fill', '#f0f0ff'), 'outline': ('actor_outline', '#000')},
+    'actor_text': {'fill': ('actor_text', None)},
+    'lifeline': {'fill': ('lifeline', '#888')},
+    'actor_outline': {'outline': ('accent', '#4a90e2')},
+    'interaction_line': {'fill': ('label_fg', None)},
+    'interaction_outline': {'fill': ('accent', '#4a90e2')},
+    'label': {'fill': ('label_fg', None)},
+    'index': {'fill': ('index_fg', None)},
+    'preview': {'fill': ('preview_line', None)},
+}
+
+# Canvas dash pattern per interaction style (styles not listed draw solid)
+DASH_FOR_STYLE = {'dashed': (6, 4)}
+
 
 class CanvasController:
     def __init__(self, app):
@@ -22,46 +56,136 @@ class CanvasController:
         self.dragging_interaction = False
         # small movement threshold to distinguish click vs drag
         self._drag_threshold = 6
+        self._drag_threshold_sq = self._drag_threshold ** 2
+        # actor hit testing: x buckets keyed by x // GRID_CELL holding precomputed
+        # (left, right, top, bottom, actor) boxes. Actors normally share one row, so
+        # bucketing by x alone keeps each lookup to three buckets.
+        # Rebuilt on every redraw, and lazily when the actors list is replaced or grows
+        # or an actor was moved (_hit_index_dirty). Id lookups use app.actor_by_id.
+        self._actor_grid: Dict[int, List[Tuple[int, int, int, int, Actor]]] = {}
+        self._indexed_actors = None
+        self._indexed_count = 0
+        self._hit_index_dirty = False
+        # bounding band of all actor boxes; points outside it can't hit any actor
+        self._actor_x_lo = self._actor_y_lo = 0
+        self._actor_x_hi = self._actor_y_hi = -1
+        # dash pattern the preview line was last configured with
+        self._preview_dash = None
+        # the preview line (app.temp_line) is created once and hidden between drags
+        self._preview_visible = False
+        # latest unprocessed <B1-Motion> position; intermediate positions are dropped
+        self._pending_drag_xy: Optional[Tuple[int, int]] = None
+        # time.monotonic() of the last processed drag position
+        self._last_drag_ts = 0.0
+        # funcid of the <B1-Motion> binding while a press on an actor is held
+        self._motion_bind_id: Optional[str] = None
+        # actor id -> [outline_id, rect_id, text_id, lifeline_id] of the drawn actors
+        self._actor_items: Dict[int, List[Optional[int]]] = {}
+        # row index -> [outline_id, line_id, label_id, index_id] of the drawn interaction rows
+        self._row_items: Dict[int, List[Optional[int]]] = {}
+        # ROLE_COLORS resolved against the palette object in _colors_palette
+        self._colors: Dict[str, Dict[str, Optional[str]]] = {}
+        self._colors_palette = None
+        # hidden line items of rows that are no longer drawn, reused by _acquire_line
+        self._line_pool: List[int] = []
+        # actor id -> indices of the drawn interaction rows that start or end at it
+        self._rows_by_actor: Dict[int, List[int]] = {}
+        # canvas item id -> interaction index for every item tagged 'interaction'
+        self._item_to_interaction: Dict[int, int] = {}
+        # (scene_version, selected interaction index) of the last full redraw
+        self._last_drawn_scene = None
+        # only visible interaction rows are drawn, so redraw when the canvas is resized
+        self._culled_height = None
+        # canvas width used to clamp actor drags; read once per drag and kept current by <Configure>
+        self._cached_canvas_width = None
+        self.canvas.bind('<Configure>', self._on_canvas_configure, add='+')
+        # single-click selects, double-click edits label; bound once for all interaction items
+        self.canvas.tag_bind("interaction", "<Button-1>", self._on_interaction_click)
+        self.canvas.tag_bind("interaction", "<Double-Button-1>", self._on_interaction_double_click)
 
-    def find_actor_at(self, x, y) -> Optional[Actor]:
+    def _index_actors(self):
+        """Rebuild the x buckets from `app.actors`."""
+        grid: Dict[int, List[Tuple[int, int, int, int, Actor]]] = {}
+        x_lo = y_lo = float('inf')
+        x_hi = y_hi = float('-inf')
+        bx0, by0, bx1, by1 = ACTOR_BOX_OFFSETS
         for actor in self.app.actors:
-            left = actor.x - ACTOR_WIDTH // 2
-            right = actor.x + ACTOR_WIDTH // 2
-            top = actor.y
-            bottom = actor.y + ACTOR_HEIGHT
-            if left <= x <= right and top <= y <= bottom:
-                return actor
+            x, y = actor.x, actor.y
+            box = (x + bx0, x + bx1, y + by0, y + by1, actor)
+            grid.setdefault(x // GRID_CELL, []).append(box)
+            x_lo = min(x_lo, box[0])
+            x_hi = max(x_hi, box[1])
+            y_lo = min(y_lo, box[2])
+            y_hi = max(y_hi, box[3])
+        self._actor_x_lo, self._actor_x_hi = x_lo, x_hi
+        self._actor_y_lo, self._actor_y_hi = y_lo, y_hi
+        self._actor_grid = grid
+        self._indexed_actors = self.app.actors
+        self._indexed_count = len(self.app.actors)
+        self._hit_index_dirty = False
+
+    def _ensure_actor_index(self):
+        actors = self.app.actors
+        if self._hit_index_dirty or actors is not self._indexed_actors or len(actors) != self._indexed_count:
+            self._index_actors()
+
+    def find_actor_at(self, x, y) -> Optional[Actor]:
+        self._ensure_actor_index()
+        # all actors share one row, so most points (e.g. while dragging below it) are rejected here
+        if y < self._actor_y_lo or y > self._actor_y_hi or x < self._actor_x_lo or x > self._actor_x_hi:
+            return None
+        cx = x // GRID_CELL
+        grid = self._actor_grid
+        for gx in (cx - 1, cx, cx + 1):
+            for left, right, top, bottom, actor in grid.get(gx, ()):
+                if left <= x <= right and top <= y <= bottom:
+                    return actor
         return None
 
     def get_actor_by_id(self, id_: int) -> Optional[Actor]:
-        for a in self.app.actors:
-            if a.id == id_:
-                return a
-        return None
+        return self.app.actor_by_id.get(id_)
 
     # Canvas event handlers
+    def _on_canvas_configure(self, event):
+        self._cached_canvas_width = event.width
+        if event.height != self._culled_height:
+            self.app.bump_scene_version()
+            self._schedule_redraw()
+
+    def _interaction_under_pointer(self) -> Optional[int]:
+        current = self.canvas.find_withtag("current")
+        if not current:
+            return None
+        return self._item_to_interaction.get(current[0])
+
+    def _on_interaction_click(self, event):
+        idx = self._interaction_under_pointer()
+        if idx is not None:
+            self.app.interaction_manager.select_interaction(idx)
+
+    def _on_interaction_double_click(self, event):
+        idx = self._interaction_under_pointer()
+        if idx is not None:
+            self.app.interaction_manager.edit_interaction_label_at(idx)
+
     def on_canvas_press(self, event):
         x, y = event.x, event.y
         actor = self.find_actor_at(x, y)
         # If the click landed on an interaction canvas item, don't clear selection here;
         # let the item's tag bindings handle selection. Check current items under pointer.
+        # find_closest returns just the nearest item, so also make sure the point is inside its bbox
         try:
-            items = self.canvas.find_overlapping(x, y, x, y)
-            for it in items:
-                tags = self.canvas.gettags(it) or ()
-                for t in tags:
-                    if isinstance(t, str) and t.startswith('interaction_'):
-                        # parse index from tag 'interaction_{i}' and select that interaction
-                        try:
-                            idx = int(t.split('_', 1)[1])
-                            try:
-                                self.app.interaction_manager.select_interaction(idx)
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-                        # done handling the click
-                        return
+            items = self.canvas.find_closest(x, y, halo=0)
+            idx = self._item_to_interaction.get(items[0]) if items else None
+            if idx is not None:
+                x1, y1, x2, y2 = self.canvas.bbox(items[0])
+                if x1 <= x <= x2 and y1 <= y <= y2:
+                    try:
+                        self.app.interaction_manager.select_interaction(idx)
+                    except Exception:
+                        pass
+                    # done handling the click
+                    return
         except Exception:
             pass
         # Clear any interaction listbox selection when clicking canvas (clicking an actor will select it on release)
@@ -88,11 +212,14 @@ class CanvasController:
             shift_held = False
 
         if actor:
+            # both an actor drag and an interaction drag start from an actor
+            self._bind_motion()
             if shift_held:
                 # Start actor dragging immediately when Shift is held
                 try:
                     self.app.dragging_actor = actor
                     self.app.drag_offset_x = actor.x - x
+                    self._cached_canvas_width = self.canvas.winfo_width()
                 except Exception:
                     self.app.dragging_actor = None
                 # clear transient press/interaction state
@@ -116,25 +243,66 @@ class CanvasController:
             self.press_x = None
             self.press_y = None
             try:
-                self.app.selected_actor_id = None
+                if self.app.selected_actor_id is not None:
+                    self.app.selected_actor_id = None
+                    self.app.bump_scene_version()
             except Exception:
                 pass
             try:
                 # redraw to clear any selection highlight
-                self.redraw()
+                self._schedule_redraw()
             except Exception:
                 pass
 
+    def _bind_motion(self):
+        # <B1-Motion> is only bound between a press on an actor and the release
+        if self._motion_bind_id is None:
+            self._motion_bind_id = self.canvas.bind('<B1-Motion>', self.on_canvas_drag)
+
+    def _unbind_motion(self):
+        if self._motion_bind_id is not None:
+            try:
+                self.canvas.unbind('<B1-Motion>', self._motion_bind_id)
+            except Exception:
+                pass
+            self._motion_bind_id = None
+
     def on_canvas_drag(self, event):
-        x, y = event.x, event.y
+        # Motion events can arrive faster than we draw: remember only the latest
+        # position and handle it at most once per frame (DRAG_FRAME_INTERVAL).
+        pending = self._pending_drag_xy
+        self._pending_drag_xy = (event.x, event.y)
+        if pending is None:
+            remaining = DRAG_FRAME_INTERVAL - (time.monotonic() - self._last_drag_ts)
+            if remaining <= 0:
+                self.canvas.after_idle(self._flush_drag)
+            else:
+                self.canvas.after(int(remaining * 1000) + 1, self._flush_drag)
+
+    def _flush_drag(self):
+        xy = self._pending_drag_xy
+        if xy is None:
+            return
+        self._pending_drag_xy = None
+        self._last_drag_ts = time.monotonic()
+        self._process_drag(*xy)
+
+    def _process_drag(self, x, y):
         # If an actor-drag was initiated via Shift, move the actor
         try:
             if getattr(self.app, 'dragging_actor', None):
                 new_x = x + getattr(self.app, 'drag_offset_x', 0)
                 # clamp into canvas width
-                new_x = max(ACTOR_WIDTH//2 + 10, min(self.canvas.winfo_width() - ACTOR_WIDTH//2 - 10, new_x))
-                self.app.dragging_actor.x = new_x
-                self.redraw()
+                canvas_width = self._cached_canvas_width or self.canvas.winfo_width()
+                new_x = max(ACTOR_HALF_W + 10, min(canvas_width - ACTOR_HALF_W - 10, new_x))
+                actor = self.app.dragging_actor
+                dx = new_x - actor.x
+                if not dx:
+                    # e.g. dragging further past a clamped canvas edge
+                    return
+                actor.x = new_x
+                self.app.bump_scene_version()
+                self.update_actor_position(actor, dx)
                 return
         except Exception:
             pass
@@ -143,13 +311,15 @@ class CanvasController:
         if self.pressed_actor and not self.dragging_interaction:
             dx = x - (self.press_x or 0)
             dy = y - (self.press_y or 0)
-            if hypot(dx, dy) >= self._drag_threshold:
+            if dx*dx + dy*dy >= self._drag_threshold_sq:
                 # begin interaction drag from pressed actor
                 self.dragging_interaction = True
                 try:
                     self.app.interaction_start_actor = self.pressed_actor
                 except Exception:
                     self.app.interaction_start_actor = None
+                if self.app.interaction_start_actor:
+                    self._begin_preview(self.app.interaction_start_actor)
 
         # If we are in interaction-drag mode (either because the checkbox was enabled, or we started one here)
         if self.dragging_interaction or (self.app.creating_interaction and self.app.interaction_start_actor):
@@ -157,34 +327,57 @@ class CanvasController:
             start_actor = self.app.interaction_start_actor
             if not start_actor:
                 return
-            sx = start_actor.x
-            sy = INTERACTION_START_Y
-            if self.app.temp_line:
-                try:
-                    self.canvas.delete(self.app.temp_line)
-                except Exception:
-                    pass
-            # preview style should match selected new-interaction style
-            dash = None
-            try:
-                style = self.app.new_interaction_style.get()
-            except Exception:
-                style = 'solid'
-            if style == 'dashed':
-                dash = (6, 4)
-            self.app.temp_line = self.canvas.create_line(sx, sy, x, y, arrow=tk.LAST, dash=dash, fill=self.app.palette.get('preview_line'))
+            if not self._preview_visible:
+                self._begin_preview(start_actor)
+            else:
+                # preview style should match selected new-interaction style
+                dash = self._new_interaction_dash()
+                if dash != self._preview_dash:
+                    self.canvas.itemconfigure(self.app.temp_line, dash=dash or '')
+                    self._preview_dash = dash
+            # move the preview line in place rather than recreating it
+            self.canvas.coords(self.app.temp_line, start_actor.x, INTERACTION_START_Y, x, y)
             return
 
         # Previously the app allowed dragging actors; per new behavior we don't start actor drag here.
         # If needed later we can add a modifier key to re-enable actor dragging.
 
+    def _new_interaction_dash(self):
+        return DASH_FOR_STYLE.get(getattr(self.app, '_new_style', 'solid'))
+
+    def _begin_preview(self, start_actor: Actor):
+        """Show the preview line for an interaction drag; it is moved with coords() afterwards.
+
+        The line item is created on the first drag and only hidden/shown after that.
+        """
+        sx = start_actor.x
+        sy = INTERACTION_START_Y
+        self._preview_dash = self._new_interaction_dash()
+        if self.app.temp_line is None:
+            self.app.temp_line = self.canvas.create_line(sx, sy, sx, sy, arrow=tk.LAST, dash=self._preview_dash, **self._role_colors()['preview'], tags=("preview",))
+        else:
+            self.canvas.coords(self.app.temp_line, sx, sy, sx, sy)
+            self.canvas.itemconfigure(self.app.temp_line, state='normal', dash=self._preview_dash or '')
+            self.canvas.tag_raise(self.app.temp_line)
+        self._preview_visible = True
+
+    def _hide_preview(self):
+        if self._preview_visible:
+            self.canvas.itemconfigure(self.app.temp_line, state='hidden')
+            self._preview_visible = False
+
     def on_canvas_release(self, event):
+        # apply the last motion before deciding what the release means
+        self._unbind_motion()
+        self._flush_drag()
         x, y = event.x, event.y
         # If we were dragging an actor (Shift-drag), stop moving
         try:
             if getattr(self.app, 'dragging_actor', None):
                 self.app.dragging_actor = None
                 self.app.drag_offset_x = 0
+                # the drag only moved items; one authoritative redraw settles the scene
+                self._schedule_redraw()
                 # reset transient press state
                 self.pressed_actor = None
                 self.press_x = None
@@ -195,6 +388,12 @@ class CanvasController:
 
         # If we were dragging to create an interaction (started from a press)
         if self.dragging_interaction or (self.app.creating_interaction and self.app.interaction_start_actor):
+            # the preview goes away before any dialog is shown
+            self.dragging_interaction = False
+            try:
+                self._hide_preview()
+            except Exception:
+                pass
             # determine which actor (if any) we released over
             target = self.find_actor_at(x, y)
             start_actor = self.app.interaction_start_actor
@@ -204,26 +403,21 @@ class CanvasController:
                 except Exception:
                     pass
             else:
-                # create interaction then prompt for a label
+                # appends just the new listbox row; the redraw waits for the next idle cycle
                 self.app.add_interaction(start_actor, target, label="")
-                # prompt user for a label immediately
+                # prompt user for a label; the dialog's event loop draws and lists the new interaction
                 try:
                     idx = len(self.app.interactions) - 1
                     new_label = self.app.dialogs.ask_string("Interaction label", "Enter label for this interaction:", parent=self.app.root)
-                    if new_label is not None:
+                    # cancel or an empty answer keeps the default "" label: nothing to refresh
+                    if new_label:
                         self.app.interactions[idx].label = new_label
-                        self.app.interaction_manager.update_interaction_listbox()
-                        self.redraw()
+                        self.app.bump_scene_version()
+                        self.app.schedule_listbox_refresh()
+                        self._schedule_redraw()
                 except Exception:
                     pass
             # cleanup
-            self.dragging_interaction = False
-            try:
-                if self.app.temp_line:
-                    self.canvas.delete(self.app.temp_line)
-            except Exception:
-                pass
-            self.app.temp_line = None
             self.app.interaction_start_actor = None
             self.pressed_actor = None
             self.press_x = None
@@ -233,7 +427,9 @@ class CanvasController:
         # If we pressed on an actor but did not move enough to start a drag -> treat as click (select actor)
         if self.pressed_actor:
             try:
-                self.app.selected_actor_id = self.pressed_actor.id
+                if self.app.selected_actor_id != self.pressed_actor.id:
+                    self.app.selected_actor_id = self.pressed_actor.id
+                    self.app.bump_scene_version()
                 # clear any interaction selection
                 try:
                     self.app.interaction_listbox.select_clear(0, tk.END)
@@ -243,7 +439,7 @@ class CanvasController:
                         pass
                 except Exception:
                     pass
-                self.redraw()
+                self._schedule_redraw()
             except Exception:
                 pass
 
@@ -253,72 +449,228 @@ class CanvasController:
         self.press_y = None
 
     # Drawing
+    def _schedule_redraw(self):
+        """Queue a redraw through the document so it is coalesced with every other request."""
+        self.app.schedule_redraw()
+
+    def _selected_interaction(self) -> Optional[int]:
+        try:
+            sel = self.app.interaction_listbox.curselection()
+            return sel[0] if sel else None
+        except Exception:
+            return None
+
     def redraw(self):
-        self.canvas.delete("all")
+        # nothing changed since the last full redraw -> the canvas is already up to date.
+        # The listbox selection is part of the key because it changes outside our handlers.
+        if (getattr(self.app, 'scene_version', None), self._selected_interaction()) == self._last_drawn_scene:
+            return
+        self._full_rebuild()
+
+    def _acquire_line(self, coords, **options) -> int:
+        """Return a line item at `coords` with `options`, reusing a pooled hidden line if possible."""
+        if self._line_pool:
+            line_id = self._line_pool.pop()
+            self.canvas.coords(line_id, *coords)
+            self.canvas.itemconfigure(line_id, state='normal', **options)
+            # pooled lines may sit anywhere in the stacking order
+            self.canvas.tag_raise(line_id)
+            return line_id
+        return self.canvas.create_line(*coords, **options)
+
+    def _release_line(self, line_id: int):
+        """Hide a line that is no longer drawn and keep it for _acquire_line."""
+        self.canvas.itemconfigure(line_id, state='hidden', tags=())
+        self._line_pool.append(line_id)
+
+    def _role_colors(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Return {role tag: item color options} for the current palette, resolved once per palette."""
+        palette = self.app.palette
+        if palette is not self._colors_palette:
+            p = palette.get
+            self._colors = {tag: {opt: p(key, default) for opt, (key, default) in opts.items()}
+                            for tag, opts in ROLE_COLORS.items()}
+            self._colors_palette = palette
+        return self._colors
+
+    def recolor(self):
+        """Apply the current palette to every drawn item with one itemconfigure per role tag."""
+        for tag, opts in self._role_colors().items():
+            self.canvas.itemconfigure(tag, **opts)
+
+    def update_actor_position(self, actor: Actor, dx: Optional[int] = None):
+        """Move the canvas items of `actor` and re-route its interactions after its x changed.
+
+        `dx` is how far the actor moved since it was drawn; when omitted it is read back
+        from the actor's box. Used while dragging so that moving one actor doesn't rebuild
+        the whole scene. Falls back to a full rebuild if the actor hasn't been drawn yet.
+        """
+        if actor.rect_id is None:
+            self._full_rebuild()
+            return
+        if dx is None:
+            dx = actor.x - (self.canvas.coords(actor.rect_id)[0] - ACTOR_BOX_OFFSETS[0])
+        # box, name, lifeline and selection outline all carry the actor_<id> tag
+        self.canvas.move(f"actor_{actor.id}", dx, 0)
+
+        actor_by_id = self.app.actor_by_id
+        interactions = self.app.interactions
+        for i in self._rows_by_actor.get(actor.id, ()):
+            inter = interactions[i]
+            sx = actor_by_id[inter.source_id].x
+            tx = actor_by_id[inter.target_id].x
+            y = INTERACTION_START_Y + i * INTERACTION_V_GAP
+            if inter.outline_id is not None:
+                self.canvas.coords(inter.outline_id, sx, y, tx, y)
+            self.canvas.coords(inter.line_id, sx, y, tx, y)
+            self.canvas.coords(inter.label_id, (sx + tx) // 2, y - 10)
+
+        # grid cells depend on x; rebuilt on the next hit test rather than every drag frame
+        self._hit_index_dirty = True
+
+    def _visible_interaction_range(self, count: int) -> Tuple[int, int]:
+        """Return the [first, last) indices of interaction rows inside the visible canvas area."""
+        height = self.canvas.winfo_height()
+        self._culled_height = height
+        if height <= 1:
+            # not mapped yet, so there's no viewport to cull against
+            return 0, count
+        # rows reach ~12px above/below their line (the label sits 10px above it)
+        vy0 = self.canvas.canvasy(0) - 12
+        vy1 = self.canvas.canvasy(height) + 12
+        first = max(0, int((vy0 - INTERACTION_START_Y) // INTERACTION_V_GAP))
+        last = min(count, int((vy1 - INTERACTION_START_Y) // INTERACTION_V_GAP) + 1)
+        return first, max(first, last)
+
+    def _full_rebuild(self):
+        # actor and interaction items are kept between passes and only moved/reconfigured;
+        # items are created for new actors/rows and deleted for removed ones
+        self._index_actors()
+        # color options per role, resolved once per palette
+        colors = self._role_colors()
+        selected_actor_id = getattr(self.app, 'selected_actor_id', None)
         # draw actors
+        actor_items = self._actor_items
+        created = False
+        bx0, by0, bx1, by1 = ACTOR_BOX_OFFSETS
+        ox0, oy0, ox1, oy1 = ACTOR_OUTLINE_OFFSETS
         for actor in self.app.actors:
-            left = actor.x - ACTOR_WIDTH // 2
-            top = actor.y
-            right = actor.x + ACTOR_WIDTH // 2
-            bottom = actor.y + ACTOR_HEIGHT
+            x, y = actor.x, actor.y
+            box = (x + bx0, y + by0, x + bx1, y + by1)
+            bottom = box[3]
+            items = actor_items.get(actor.id)
+            if items is None:
+                rect_id = self.canvas.create_rectangle(*box, **colors['actor_box'], tags=("actor", f"actor_{actor.id}", "actor_box"))
+                text_id = self.canvas.create_text(x, y + ACTOR_HALF_H, text=actor.name, **colors['actor_text'], tags=("actor", f"actor_{actor.id}", "actor_text"))
+                # lifeline (dashed)
+                lifeline_id = self.canvas.create_line(x, bottom, x, LIFELINE_BOTTOM, dash=(4,4), **colors['lifeline'], tags=("actor", f"actor_{actor.id}", "lifeline"))
+                items = actor_items[actor.id] = [None, rect_id, text_id, lifeline_id]
+                created = True
+            else:
+                _, rect_id, text_id, lifeline_id = items
+                self.canvas.coords(rect_id, *box)
+                self.canvas.coords(text_id, x, y + ACTOR_HALF_H)
+                self.canvas.itemconfigure(text_id, text=actor.name)
+                self.canvas.coords(lifeline_id, x, bottom, x, LIFELINE_BOTTOM)
             # if actor is selected, draw an accent outline behind it
+            outline_id = items[0]
             try:
-                if getattr(self.app, 'selected_actor_id', None) == actor.id:
+                if selected_actor_id == actor.id:
                     # slightly larger rect for outline
-                    outline_margin = 3
-                    self.canvas.create_rectangle(left - outline_margin, top - outline_margin, right + outline_margin, bottom + outline_margin, outline=self.app.palette.get('accent', '#4a90e2'), width=3)
+                    outline = (x + ox0, y + oy0, x + ox1, y + oy1)
+                    if outline_id is None:
+                        outline_id = items[0] = self.canvas.create_rectangle(*outline, width=3, **colors['actor_outline'], tags=("actor", f"actor_{actor.id}", "actor_outline"))
+                        self.canvas.tag_lower(outline_id, rect_id)
+                    else:
+                        self.canvas.coords(outline_id, *outline)
+                elif outline_id is not None:
+                    self.canvas.delete(outline_id)
+                    outline_id = items[0] = None
             except Exception:
                 pass
-            actor.rect_id = self.canvas.create_rectangle(left, top, right, bottom, fill=self.app.palette.get('actor_fill', '#f0f0ff'), outline=self.app.palette.get('actor_outline', '#000'))
-            actor.text_id = self.canvas.create_text(actor.x, actor.y + ACTOR_HEIGHT//2, text=actor.name, fill=self.app.palette.get('actor_text'))
-            # lifeline (dashed)
-            lx = actor.x
-            ly1 = bottom
-            ly2 = CANVAS_HEIGHT - 20
-            self.canvas.create_line(lx, ly1, lx, ly2, dash=(4,4), fill=self.app.palette.get('lifeline', '#888'))
+            actor.outline_id, actor.rect_id, actor.text_id, actor.lifeline_id = outline_id, rect_id, text_id, lifeline_id
+        gone = [aid for aid in actor_items if aid not in self.app.actor_by_id]
+        for aid in gone:
+            self.canvas.delete(*[iid for iid in actor_items.pop(aid) if iid is not None])
+        # keep actors underneath the interaction rows
+        if created:
+            self.canvas.tag_lower("actor")
 
         # determine currently selected interaction index (if any) from listbox
-        try:
-            sel = self.app.interaction_listbox.curselection()
-            selected_idx = sel[0] if sel else None
-        except Exception:
-            selected_idx = None
+        selected_idx = self._selected_interaction()
+        self._last_drawn_scene = (getattr(self.app, 'scene_version', None), selected_idx)
 
-        # draw interactions in order
-        for i, inter in enumerate(self.app.interactions):
-            src = self.get_actor_by_id(inter.source_id)
-            tgt = self.get_actor_by_id(inter.target_id)
+        # draw interactions in order (endpoints resolved through the document's id map),
+        # skipping rows that fall outside the visible part of the canvas.
+        # Each row keeps its canvas items between redraws: existing items are moved and
+        # reconfigured, new rows create items, and rows no longer drawn are deleted.
+        actor_by_id = self.app.actor_by_id
+        item_to_interaction = self._item_to_interaction = {}
+        rows_by_actor = self._rows_by_actor = {}
+        rows = self._row_items
+        drawn = set()
+        interactions = self.app.interactions
+        for inter in interactions:
+            inter.line_id = inter.outline_id = inter.label_id = inter.index_id = None
+        first, last = self._visible_interaction_range(len(interactions))
+        for i in range(first, last):
+            inter = interactions[i]
+            src = actor_by_id.get(inter.source_id)
+            tgt = actor_by_id.get(inter.target_id)
             if not src or not tgt:
                 continue
             y = INTERACTION_START_Y + i * INTERACTION_V_GAP
             sx = src.x
             tx = tgt.x
+            midx = (sx + tx) // 2
             # draw line with arrow from source to target
-            dash = None
-            if getattr(inter, 'style', 'solid') == 'dashed':
-                dash = (6, 4)
+            dash = DASH_FOR_STYLE.get(inter.style)
+
+            items = rows.get(i)
+            if items is None:
+                line_id = self._acquire_line((sx, y, tx, y), arrow=tk.LAST, width=2, dash=dash or '', **colors['interaction_line'], tags=("interaction", f"interaction_{i}", "interaction_line"))
+                # label and index
+                label_id = self.canvas.create_text(midx, y - 10, text=inter.label, **colors['label'], tags=("interaction", f"interaction_label_{i}", f"interaction_{i}", "label"))
+                index_id = self.canvas.create_text(40, y, text=str(i+1), **colors['index'], tags=("index",))
+                items = rows[i] = [None, line_id, label_id, index_id]
+            else:
+                _, line_id, label_id, index_id = items
+                self.canvas.coords(line_id, sx, y, tx, y)
+                self.canvas.itemconfigure(line_id, dash=dash or '')
+                self.canvas.coords(label_id, midx, y - 10)
+                self.canvas.itemconfigure(label_id, text=inter.label)
 
-            is_selected = (i == selected_idx)
             # if selected, draw a thicker outline line behind the normal line
-            if is_selected:
-                outline_color = self.app.palette.get('accent', '#4a90e2')
+            outline_id = items[0]
+            if i == selected_idx:
                 try:
-                    # wider outline line (drawn first so main line sits on top)
-                    self.canvas.create_line(sx, y, tx, y, arrow=tk.LAST, width=6, dash=dash, fill=outline_color, tags=(f"interaction_{i}",))
+                    if outline_id is None:
+                        # wider outline line, kept below the main line
+                        outline_id = items[0] = self._acquire_line((sx, y, tx, y), arrow=tk.LAST, width=6, dash=dash or '', **colors['interaction_outline'], tags=("interaction", f"interaction_{i}", "interaction_outline"))
+                        self.canvas.tag_lower(outline_id, line_id)
+                    else:
+                        self.canvas.coords(outline_id, sx, y, tx, y)
+                        self.canvas.itemconfigure(outline_id, dash=dash or '')
+                    item_to_interaction[outline_id] = i
                 except Exception:
-                    pass
+                    outline_id = None
+            elif outline_id is not None:
+                self._release_line(outline_id)
+                outline_id = items[0] = None
 
-            line_color = self.app.palette.get('label_fg')
-            line = self.canvas.create_line(sx, y, tx, y, arrow=tk.LAST, width=2, dash=dash, fill=line_color, tags=(f"interaction_{i}",))
-            # label and index
-            midx = (sx + tx) // 2
-            self.canvas.create_text(midx, y - 10, text=inter.label, fill=self.app.palette.get('label_fg'), tags=(f"interaction_label_{i}", f"interaction_{i}"))
-            self.canvas.create_text(40, y, text=str(i+1), fill=self.app.palette.get('index_fg'))
-            # bind canvas events for selection and editing (single-click selects, double-click edits label)
-            try:
-                self.canvas.tag_bind(f"interaction_{i}", "<Button-1>", lambda e, ii=i: self.app.interaction_manager.select_interaction(ii))
-                self.canvas.tag_bind(f"interaction_{i}", "<Double-Button-1>", lambda e, ii=i: self.app.interaction_manager.edit_interaction_label_at(ii))
-            except Exception:
-                pass
+            inter.outline_id, inter.line_id, inter.label_id, inter.index_id = outline_id, line_id, label_id, index_id
+            item_to_interaction[line_id] = i
+            item_to_interaction[label_id] = i
+            rows_by_actor.setdefault(src.id, []).append(i)
+            if tgt.id != src.id:
+                rows_by_actor.setdefault(tgt.id, []).append(i)
+            drawn.add(i)
+
+        for i in [i for i in rows if i not in drawn]:
+            outline_id, line_id, label_id, index_id = rows.pop(i)
+            if outline_id is not None:
+                self._release_line(outline_id)
+            self._release_line(line_id)
+            self.canvas.delete(label_id, index_id)
 
         # NOTE: removed the call to update_interaction_listbox() here to avoid a redraw -> listbox update -> redraw recursion
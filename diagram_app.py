@@ -3,15 +3,17 @@ DiagramApp module — contains the DiagramApp class exported for a small launche
 This file was created by extracting the DiagramApp class from main.py to improve modularity.
 """
 import tkinter as tk
-from tkinter import filedialog
+from contextlib import contextmanager
 from tkinter import ttk, font as tkfont
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import prefs
 import json
 from pathlib import Path
 import sys
+import threading
+import weakref
 from theme import palette_for_theme
-from ui_utils import center_window
+from ui_utils import center_window, safe_configure
 
 from models import (
     Actor,
@@ -27,11 +29,65 @@ from models import (
     ACTOR_TEXT_COLOR,
     PREVIEW_LINE_COLOR,
 )
-from dialogs import ThemedDialogs
-from export_utils import export_canvas
 from canvas_controller import CanvasController
 from interaction_manager import InteractionManager
 
+# platform-aware accelerator labels and the modifiers their key bindings use
+_MAC = sys.platform == 'darwin'
+_ACCEL_MOD = 'Cmd' if _MAC else 'Ctrl'
+ACCEL_NEW = f'{_ACCEL_MOD}+N'
+ACCEL_OPEN = f'{_ACCEL_MOD}+O'
+ACCEL_SAVE = f'{_ACCEL_MOD}+S'
+ACCEL_SAVE_AS = f'{_ACCEL_MOD}+Shift+S'
+ACCEL_BIND_MODIFIERS = ('Control', 'Command') if _MAC else ('Control',)
+
+try:
+    import orjson  # optional: faster diagram save/load
+except ImportError:
+    orjson = None
+
+
+def _dumps_diagram(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads_diagram(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_diagram_bytes(raw: bytes) -> Tuple[List[Actor], List[Interaction], int]:
+    """Parse a saved diagram into (actors, interactions, next_actor_id). Touches no widgets."""
+    data = _loads_diagram(raw)
+    actors = [Actor(id=int(a['id']), name=str(a.get('name', '')), x=int(a.get('x', 100)), y=int(a.get('y', 20)))
+              for a in data.get('actors', ())]
+    interactions = [Interaction(source_id=int(it['source_id']), target_id=int(it['target_id']),
+                                label=str(it.get('label', '')), style=str(it.get('style', 'solid')))
+                    for it in data.get('interactions', ())]
+    next_id = int(data.get('next_actor_id', (max((a.id for a in actors), default=0) + 1)))
+    return actors, interactions, next_id
+
+# ttk style name -> fn(app, palette) returning that style's configure options
+STYLE_TABLE = (
+    ('TFrame', lambda app, p: {'background': p['app_bg']}),
+    ('Card.TFrame', lambda app, p: {'background': p['card_bg']}),
+    ('Card.TLabel', lambda app, p: {'background': p['card_bg'], 'font': app.small_font, 'foreground': p['text_fg']}),
+    ('TLabel', lambda app, p: {'background': p['app_bg'], 'font': app.small_font, 'foreground': p['text_fg']}),
+    ('Header.TLabel', lambda app, p: {'background': p['app_bg'], 'font': app.header_font, 'foreground': p['text_fg']}),
+    ('Accent.TButton', lambda app, p: {'foreground': 'white', 'background': p['accent'], 'font': app.small_font}),
+    ('Card.TCombobox', lambda app, p: {'fieldbackground': p['card_bg'], 'background': p['card_bg'], 'foreground': p['text_fg']}),
+)
+
+def option_menu_conf(palette: dict):
+    """Return the (OptionMenu button, dropdown menu) configure options for `palette`."""
+    card = palette.get('card_bg')
+    text = palette.get('text_fg')
+    return ({'bg': card, 'fg': text, 'activebackground': card, 'highlightthickness': 0},
+            {'bg': card, 'fg': text, 'activebackground': palette.get('accent')})
+
 class Document:
     """Represents a single diagram document (model + UI widgets + controllers).
 
@@ -40,11 +96,18 @@ class Document:
     those classes unchanged) and owns its canvas and listbox widgets.
     """
     def __init__(self, app, title: str = 'Untitled'):
-        self.app = app  # reference back to DiagramApp for dialogs, palette, root
+        # reference back to DiagramApp for dialogs, palette, root; a proxy so the
+        # app's documents list doesn't form a reference cycle with each document
+        self.app = weakref.proxy(app)
         self.title = title
 
         # Model
         self.actors = []
+        # x of the next actor added via add_actor_dialog (one slot right of the last)
+        self._next_x = 100
+        # actor id -> Actor for self.actors; kept in step by add_actor_dialog and
+        # load_diagram and shared with the canvas controller
+        self.actor_by_id = {}
         self.interactions = []
         self.next_actor_id = 1
         self.current_file = None
@@ -55,6 +118,14 @@ class Document:
         self.creating_interaction = False
         self.selected_actor_id = None
         self.dragging_actor = None
+        # bumped whenever what the canvas shows changes; lets redraw() skip identical scenes
+        self.scene_version = 0
+        # redraw / listbox refresh coalescing: see schedule_redraw(), schedule_listbox_refresh()
+        # and batch_updates(); both run from a single idle callback, _flush_updates()
+        self._redraw_pending = False
+        self._listbox_pending = False
+        self._flush_scheduled = False
+        self._batch_depth = 0
         self.drag_offset_x = 0
 
         # App-level helpers (copied from DiagramApp for controllers to use)
@@ -62,20 +133,28 @@ class Document:
             self.palette = getattr(app, 'palette', {})
         except Exception:
             self.palette = {}
-        self.dialogs = getattr(app, 'dialogs', None)
         self.root = getattr(app, 'root', None)
 
         # Widget refs (populated by create_ui)
         self.frame = None
         self.canvas = None
         self.interaction_listbox = None
+        # listvariable of interaction_listbox; setting it replaces all rows in one Tk call
+        self.interaction_list_var = None
         self.style_menu = None
+        self._new_interaction_style_menu = None
         self.style_var = tk.StringVar(value='solid')
         self.new_interaction_style = tk.StringVar(value='solid')
+        # style for new interactions, kept in step by the OptionMenu's command so
+        # creating an interaction doesn't read the Tcl variable
+        self._new_style = 'solid'
+        # widget key -> options last applied by apply_palette
+        self._applied_conf = {}
 
-        # Controllers (set after widgets created)
+        # Controllers (set after widgets created); _ready flips once they exist
         self.canvas_controller = None
         self.interaction_manager = None
+        self._ready = False
 
     def create_ui(self, parent):
         """Create UI for this document inside `parent` (a ttk.Frame used as tab).
@@ -100,143 +179,205 @@ class Document:
         style_frame = ttk.Frame(controls_card, style='Card.TFrame')
         style_frame.pack(padx=8, pady=(0,8), anchor=tk.NW, fill=tk.X)
         tk.Label(style_frame, text='New Interaction Style:', bg=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), font=self.app.small_font).pack(side=tk.LEFT)
-        self._new_interaction_style_menu = tk.OptionMenu(style_frame, self.new_interaction_style, 'solid', 'dashed')
+        self._new_interaction_style_menu = tk.OptionMenu(style_frame, self.new_interaction_style, 'solid', 'dashed', command=self._on_new_style_pick)
         self._new_interaction_style_menu.config(borderwidth=0, highlightthickness=0)
         self._new_interaction_style_menu.pack(side=tk.LEFT, padx=4)
 
         ttk.Label(right, text='Interactions:', style='Header.TLabel').pack(padx=8, pady=(12,0), anchor=tk.NW)
         list_card = ttk.Frame(right, style='Card.TFrame')
         list_card.pack(padx=8, pady=8, fill=tk.BOTH, expand=False)
-        self.interaction_listbox = tk.Listbox(list_card, width=40, height=12, bd=0, highlightthickness=0, activestyle='none', bg=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), selectbackground=self.palette.get('accent'), selectforeground='white')
+        self.interaction_list_var = tk.StringVar()
+        self.interaction_listbox = tk.Listbox(list_card, listvariable=self.interaction_list_var, width=40, height=12, bd=0, highlightthickness=0, activestyle='none', bg=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), selectbackground=self.palette.get('accent'), selectforeground='white')
         self.interaction_listbox.pack(padx=6, pady=6)
 
         btn_frame = ttk.Frame(list_card, style='Card.TFrame')
         btn_frame.pack(padx=8, pady=(6,8), fill=tk.X)
-        self.up_btn = ttk.Button(btn_frame, text='Up', command=lambda: self.interaction_manager.move_interaction_up(), style='Accent.TButton')
+        self.up_btn = ttk.Button(btn_frame, text='Up', style='Accent.TButton', state='disabled')
         self.up_btn.grid(row=0, column=0, padx=4)
-        self.down_btn = ttk.Button(btn_frame, text='Down', command=lambda: self.interaction_manager.move_interaction_down(), style='Accent.TButton')
+        self.down_btn = ttk.Button(btn_frame, text='Down', style='Accent.TButton', state='disabled')
         self.down_btn.grid(row=0, column=1, padx=4)
-        self.edit_btn = ttk.Button(btn_frame, text='Edit', command=lambda: self.interaction_manager.edit_interaction_label(), style='Accent.TButton')
+        self.edit_btn = ttk.Button(btn_frame, text='Edit', style='Accent.TButton', state='disabled')
         self.edit_btn.grid(row=0, column=2, padx=4)
-        self.delete_btn = ttk.Button(btn_frame, text='Delete', command=lambda: self.interaction_manager.delete_interaction(), style='Accent.TButton')
+        self.delete_btn = ttk.Button(btn_frame, text='Delete', style='Accent.TButton', state='disabled')
         self.delete_btn.grid(row=0, column=3, padx=4)
 
-        self.style_menu = tk.OptionMenu(btn_frame, self.style_var, 'solid', 'dashed', command=lambda _=None: self.interaction_manager.on_style_change())
+        self.style_menu = tk.OptionMenu(btn_frame, self.style_var, 'solid', 'dashed', command=self._on_style_pick)
         self.style_menu.grid(row=0, column=4, padx=8)
-        try:
-            self.style_menu.configure(state='disabled')
-        except Exception:
-            pass
-        try:
-            self.up_btn.configure(state='disabled')
-            self.down_btn.configure(state='disabled')
-            self.edit_btn.configure(state='disabled')
-            self.delete_btn.configure(state='disabled')
-        except Exception:
-            pass
+        # nothing is selected yet: the row actions start disabled
+        self.style_menu.configure(state='disabled')
+
+        self._bind_controllers()
+        return self.frame
 
-        # Create controllers bound to this document
+    def _bind_controllers(self):
+        """Create the controllers for the widgets built by create_ui and wire up their events."""
         self.canvas_controller = CanvasController(self)
         self.interaction_manager = InteractionManager(self)
+        self._ready = True
 
         # Bind canvas events to the controller
         self.canvas.bind('<ButtonPress-1>', self.canvas_controller.on_canvas_press)
-        self.canvas.bind('<B1-Motion>', self.canvas_controller.on_canvas_drag)
+        # <B1-Motion> is bound by the controller only while a press may turn into a drag
         self.canvas.bind('<ButtonRelease-1>', self.canvas_controller.on_canvas_release)
-        try:
-            self.canvas.bind('<Button-3>', lambda e: self.app.show_canvas_context_menu(e, doc=self))
-            self.canvas.bind('<Button-2>', lambda e: self.app.show_canvas_context_menu(e, doc=self))
-            self.canvas.bind('<Control-Button-1>', lambda e: self.app.show_canvas_context_menu(e, doc=self))
-        except Exception:
-            pass
+        for seq in ('<Button-3>', '<Button-2>', '<Control-Button-1>'):
+            self.canvas.bind(seq, self._show_context_menu)
 
         # Listbox selection handling
         self.interaction_listbox.bind('<<ListboxSelect>>', self.interaction_manager.on_interaction_select)
+        # the list buttons call straight into the manager
+        im = self.interaction_manager
+        self.up_btn.configure(command=im.move_interaction_up)
+        self.down_btn.configure(command=im.move_interaction_down)
+        self.edit_btn.configure(command=im.edit_interaction_label)
+        self.delete_btn.configure(command=im.delete_interaction)
 
-        return self.frame
+    def _show_context_menu(self, event):
+        self.app.show_canvas_context_menu(event, doc=self)
+
+    def _on_style_pick(self, value=None):
+        self.interaction_manager.on_style_change(value)
+
+    def _on_new_style_pick(self, value):
+        self._new_style = value or 'solid'
 
     # Model actions
     def add_actor_dialog(self):
         name = self.app.dialogs.ask_string('Actor name', 'Enter actor name:')
         if not name:
             return
-        x = 100 + (len(self.actors) * (ACTOR_WIDTH + 40))
-        actor = Actor(id=self.next_actor_id, name=name, x=x)
+        actor = Actor(id=self.next_actor_id, name=name, x=self._next_x)
+        self._next_x += ACTOR_WIDTH + 40
         self.next_actor_id += 1
         self.actors.append(actor)
-        try:
-            self.canvas_controller.redraw()
-        except Exception:
-            pass
+        self.actor_by_id[actor.id] = actor
+        self.bump_scene_version()
+        self.schedule_redraw()
 
     def add_interaction(self, source: Actor, target: Actor, label: str = ''):
         if source.id == target.id:
             self.app.dialogs.info('Invalid', 'Cannot create interaction to the same actor')
             return
-        style_val = self.new_interaction_style.get() if isinstance(self.new_interaction_style, tk.StringVar) else 'solid'
+        style_val = self._new_style
         self.interactions.append(Interaction(source_id=source.id, target_id=target.id, label=label, style=style_val))
-        try:
-            self.interaction_manager.update_interaction_listbox()
-            self.canvas_controller.redraw()
-        except Exception:
-            pass
+        self.bump_scene_version()
+        if self._batch_depth or self._listbox_pending:
+            # a full refresh is coming anyway; it will include the new row
+            self.schedule_listbox_refresh()
+        else:
+            try:
+                # only the new row is added; existing rows and the selection are untouched
+                self.interaction_manager.append_interaction_row()
+            except Exception:
+                pass
+        self.schedule_redraw()
 
     def save_diagram(self, path: str):
         data = {'actors': [{'id': a.id, 'name': a.name, 'x': a.x, 'y': a.y} for a in self.actors],
                 'interactions': [{'source_id': i.source_id, 'target_id': i.target_id, 'label': i.label, 'style': getattr(i, 'style', 'solid')} for i in self.interactions],
                 'next_actor_id': self.next_actor_id}
-        with open(path, 'w', encoding='utf-8') as fh:
-            json.dump(data, fh, indent=2)
+        with open(path, 'wb') as fh:
+            fh.write(_dumps_diagram(data))
         self.current_file = Path(path)
         return path
 
     def load_diagram(self, path: str):
-        with open(path, 'r', encoding='utf-8') as fh:
-            data = json.load(fh)
-        actors = []
-        interactions = []
-        for a in data.get('actors', []):
-            actors.append(Actor(id=int(a['id']), name=str(a.get('name', '')), x=int(a.get('x', 100)), y=int(a.get('y', 20))))
-        for it in data.get('interactions', []):
-            interactions.append(Interaction(source_id=int(it['source_id']), target_id=int(it['target_id']), label=str(it.get('label', '')), style=str(it.get('style', 'solid'))))
-        self.actors = actors
-        self.interactions = interactions
-        self.next_actor_id = int(data.get('next_actor_id', (max((a.id for a in actors), default=0) + 1)))
-        try:
-            self.interaction_manager.update_interaction_listbox()
-            self.canvas_controller.redraw()
-        except Exception:
-            pass
+        with open(path, 'rb') as fh:
+            raw = fh.read()
+        self.set_diagram(*_parse_diagram_bytes(raw))
+
+    def set_diagram(self, actors: List[Actor], interactions: List[Interaction], next_id: int):
+        """Replace the model with parsed diagram content."""
+        # swap the whole model in, then refresh the listbox and canvas once
+        with self.batch_updates():
+            self.actors = actors
+            self.actor_by_id = {a.id: a for a in actors}
+            self.interactions = interactions
+            self.next_actor_id = next_id
+            self._next_x = 100 + len(actors) * (ACTOR_WIDTH + 40)
+            self.bump_scene_version()
+            self.schedule_listbox_refresh()
+            self.schedule_redraw()
 
     def apply_palette(self, palette: dict):
         """Update this document's widgets to use the provided palette."""
+        # widgets are built with self.palette, so an equal palette has nothing to change
+        if palette is self.palette or palette == self.palette:
+            return
+        self.palette = palette
+        # the app resolves these once per theme switch for all documents
+        if palette is getattr(self.app, 'palette', None) and getattr(self.app, 'menu_conf', None):
+            button_conf, dropdown_conf = self.app.menu_conf
+        else:
+            button_conf, dropdown_conf = option_menu_conf(palette)
+        # widgets are None until create_ui() builds them
+        for key, menu in (('_new_interaction_style_menu', self._new_interaction_style_menu), ('style_menu', self.style_menu)):
+            if menu is not None:
+                self._configure_if_changed(key, menu, button_conf)
+                self._configure_if_changed(key + '.menu', menu['menu'], dropdown_conf)
+        if self.canvas is not None:
+            self._configure_if_changed('canvas', self.canvas, {'bg': palette.get('canvas_bg')})
+        # recolor the drawn items in place; colors don't affect layout, so no redraw is needed
+        if self._ready:
+            self.canvas_controller.recolor()
+
+    def _configure_if_changed(self, key: str, widget, options: dict):
+        # apply_palette runs on every theme switch; skip widgets whose options are already set
+        if self._applied_conf.get(key) != options:
+            safe_configure(widget, **options)
+            self._applied_conf[key] = options
+
+    @property
+    def dialogs(self):
+        # the app builds its dialog helpers lazily, so always ask it
+        return self.app.dialogs
+
+    def bump_scene_version(self):
+        """Mark the scene as changed so the next redraw() rebuilds the canvas."""
+        self.scene_version += 1
+
+    def schedule_redraw(self):
+        """Redraw on the next idle cycle; any further requests until then share that redraw."""
+        self._redraw_pending = True
+        self._schedule_flush()
+
+    def schedule_listbox_refresh(self):
+        """Rebuild the interaction listbox on the next idle cycle, once for any number of requests."""
+        self._listbox_pending = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._batch_depth or self._flush_scheduled:
+            return
+        self._flush_scheduled = True
         try:
-            self.palette = palette
-        except Exception:
-            pass
-        try:
-            if getattr(self, '_new_interaction_style_menu', None):
-                try:
-                    self._new_interaction_style_menu.configure(bg=palette.get('card_bg'), fg=palette.get('text_fg'), activebackground=palette.get('card_bg'), highlightthickness=0)
-                    self._new_interaction_style_menu['menu'].configure(bg=palette.get('card_bg'), fg=palette.get('text_fg'), activebackground=palette.get('accent'))
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if getattr(self, 'style_menu', None):
-                try:
-                    self.style_menu.configure(bg=palette.get('card_bg'), fg=palette.get('text_fg'), activebackground=palette.get('card_bg'), highlightthickness=0)
-                    self.style_menu['menu'].configure(bg=palette.get('card_bg'), fg=palette.get('text_fg'), activebackground=palette.get('accent'))
-                except Exception:
-                    pass
+            self.root.after_idle(self._flush_updates)
         except Exception:
-            pass
+            self._flush_updates()
+
+    def _flush_updates(self):
+        """Run the pending listbox refresh and redraw, each at most once."""
+        self._flush_scheduled = False
+        if not self._ready:
+            return
+        # listbox first: the redraw reads its selection
+        if self._listbox_pending:
+            self._listbox_pending = False
+            self.interaction_manager.update_interaction_listbox()
+        if self._redraw_pending:
+            self._redraw_pending = False
+            self.canvas_controller.redraw()
+
+    @contextmanager
+    def batch_updates(self):
+        """Hold back schedule_redraw() and schedule_listbox_refresh() until the outermost
+        batch exits, then run each of them once."""
+        self._batch_depth += 1
         try:
-            if getattr(self, 'canvas', None):
-                self.canvas.configure(bg=palette.get('canvas_bg'))
-        except Exception:
-            pass
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and (self._listbox_pending or self._redraw_pending):
+                self._schedule_flush()
 
     # Helpers expected by controllers/manager (mirror prior DiagramApp API)
     def find_actor_at(self, x, y):
@@ -245,13 +386,7 @@ class Document:
         return None
 
     def get_actor_by_id(self, id_):
-        if getattr(self, 'canvas_controller', None):
-            return self.canvas_controller.get_actor_by_id(id_)
-        # fallback: scan actors list
-        for a in self.actors:
-            if a.id == id_:
-                return a
-        return None
+        return self.actor_by_id.get(id_)
 
     def redraw(self):
         if getattr(self, 'canvas_controller', None):
@@ -262,8 +397,9 @@ class DiagramApp:
     def __init__(self, root: tk.Tk):
         self.root = root
         root.title("Sequence Diagram Editor")
-        # Modernize UI: use ttk styles, fonts and soft background
-        self.root.configure(background="#f5f7fa")
+        # keep the window hidden while widgets are built so it is laid out and painted once
+        root.withdraw()
+        # Modernize UI: use ttk styles, fonts and soft background (set by apply_theme below)
         self.style = ttk.Style()
         try:
             # prefer a clean theme
@@ -279,25 +415,38 @@ class DiagramApp:
 
         # Theme & preferences: load saved pref and detect system
         self.config = prefs.load_preferences()
+        # ttk style name -> configure options last applied (see apply_theme)
+        self._applied_styles = {}
+        # Accent.TButton state map last applied
+        self._applied_accent_map = None
+        # pending after() id of a deferred preferences write (see save_preferences_deferred)
+        self._prefs_save_after = None
+        # serialized config as last read/written; a deferred write is skipped if it still matches
+        self._last_saved_prefs = json.dumps(self.config, sort_keys=True)
+        # make sure a deferred write isn't lost when the window is closed
+        try:
+            self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+        except Exception:
+            pass
         self.user_theme_pref = self.config.get('theme', 'system')
         eff = self.user_theme_pref
         if eff == 'system':
             eff = prefs.detect_system_theme()
         # palette will be set by apply_theme
-        self.apply_theme(eff)
+        self.apply_theme(eff, initial=True)
 
-        # dialog helpers (use themed dialogs when possible, fallback to BasicDialogs)
-        try:
-            self.dialogs = ThemedDialogs(self)
-        except Exception:
-            try:
-                from dialogs import BasicDialogs
-                self.dialogs = BasicDialogs(self.root)
-            except Exception:
-                self.dialogs = None
+        # dialog helpers are created on first use; see the `dialogs` property
+        self._dialogs = None
+        # canvas context menu, built on first right-click (see show_canvas_context_menu)
+        self._ctx_menu = None
+        self._ctx_doc: Optional[Document] = None
+        # single worker thread for export encoding, started by the first export
+        self._export_pool = None
 
         # Document management
         self.documents: List[Document] = []
+        # notebook tab id (page widget path) -> document
+        self._tab_to_doc = {}
         self.active_document: Optional[Document] = None
 
         # Layout
@@ -316,29 +465,22 @@ class DiagramApp:
 
         # Application menu (menubar) with Theme submenu
         # Use a menubar radiobutton menu for theme selection instead of an in-pane OptionMenu.
+        # theme_var exists even if building the menus below fails
+        disp = {'system':'System','light':'Light','dark':'Dark'}.get(self.user_theme_pref, 'System')
+        self.theme_var = tk.StringVar(value=disp)
         try:
-            self.theme_var = tk.StringVar()
-            disp = {'system':'System','light':'Light','dark':'Dark'}.get(self.user_theme_pref, 'System')
-            self.theme_var.set(disp)
-
             self.menubar = tk.Menu(self.root)
             self.root.config(menu=self.menubar)
 
             # File menu: New / Open / Save / Save As / Export
             self._file_menu = tk.Menu(self.menubar, tearoff=0)
             self.menubar.add_cascade(label='File', menu=self._file_menu)
-            # platform-aware accelerator labels
-            accel_save = 'Cmd+S' if sys.platform == 'darwin' else 'Ctrl+S'
-            accel_open = 'Cmd+O' if sys.platform == 'darwin' else 'Ctrl+O'
-            accel_new = 'Cmd+N' if sys.platform == 'darwin' else 'Ctrl+N'
-            accel_saveas = 'Cmd+Shift+S' if sys.platform == 'darwin' else 'Ctrl+Shift+S'
-
-            self._file_menu.add_command(label=f'New\t{accel_new}', command=lambda: self.new_diagram(), accelerator=accel_new)
-            self._file_menu.add_command(label=f'Open...\t{accel_open}', command=lambda: self.load_diagram_dialog(), accelerator=accel_open)
-            self._file_menu.add_command(label=f'Save\t{accel_save}', command=lambda: self.save(), accelerator=accel_save)
-            self._file_menu.add_command(label=f'Save As...\t{accel_saveas}', command=lambda: self.save_diagram_dialog(), accelerator=accel_saveas)
+            self._file_menu.add_command(label=f'New\t{ACCEL_NEW}', command=self.new_diagram, accelerator=ACCEL_NEW)
+            self._file_menu.add_command(label=f'Open...\t{ACCEL_OPEN}', command=self.load_diagram_dialog, accelerator=ACCEL_OPEN)
+            self._file_menu.add_command(label=f'Save\t{ACCEL_SAVE}', command=self.save, accelerator=ACCEL_SAVE)
+            self._file_menu.add_command(label=f'Save As...\t{ACCEL_SAVE_AS}', command=self.save_diagram_dialog, accelerator=ACCEL_SAVE_AS)
             self._file_menu.add_separator()
-            self._file_menu.add_command(label='Export...', command=lambda: self.export_dialog())
+            self._file_menu.add_command(label='Export...', command=self.export_dialog)
 
             # Preferences / Theme menu
             self._prefs_menu = tk.Menu(self.menubar, tearoff=0)
@@ -353,25 +495,16 @@ class DiagramApp:
             # Global key bindings for accelerators (bind both Control and Command on macOS)
             try:
                 # Use root.bind_all so accelerators work regardless of focus inside the app
-                self.root.bind_all('<Control-s>', lambda e: (self.save() or True) and 'break')
-                self.root.bind_all('<Control-o>', lambda e: (self.load_diagram_dialog() or True) and 'break')
-                self.root.bind_all('<Control-n>', lambda e: (self.new_diagram() or True) and 'break')
-                self.root.bind_all('<Control-Shift-S>', lambda e: (self.save_diagram_dialog() or True) and 'break')
-                if sys.platform == 'darwin':
-                    # Command key on macOS
-                    self.root.bind_all('<Command-s>', lambda e: (self.save() or True) and 'break')
-                    self.root.bind_all('<Command-o>', lambda e: (self.load_diagram_dialog() or True) and 'break')
-                    self.root.bind_all('<Command-n>', lambda e: (self.new_diagram() or True) and 'break')
-                    self.root.bind_all('<Command-Shift-S>', lambda e: (self.save_diagram_dialog() or True) and 'break')
+                for mod in ACCEL_BIND_MODIFIERS:
+                    self.root.bind_all(f'<{mod}-s>', self._acc_save)
+                    self.root.bind_all(f'<{mod}-o>', self._acc_open)
+                    self.root.bind_all(f'<{mod}-n>', self._acc_new)
+                    self.root.bind_all(f'<{mod}-Shift-S>', self._acc_save_as)
             except Exception:
                 pass
         except Exception:
             # Fall back silently if menu creation fails on a platform
-            try:
-                self.theme_var = tk.StringVar()
-                self.theme_var.set('System')
-            except Exception:
-                pass
+            pass
 
         # Create an initial empty document (adds a tab). Per-document UI is
         # created by `Document.create_ui` and controllers are bound to each
@@ -381,6 +514,24 @@ class DiagramApp:
         except Exception:
             pass
 
+        root.update_idletasks()
+        root.deiconify()
+
+    @property
+    def dialogs(self):
+        """Dialog helpers (themed when possible, falling back to BasicDialogs), built on first use."""
+        if self._dialogs is None:
+            try:
+                from dialogs import ThemedDialogs
+                self._dialogs = ThemedDialogs(self)
+            except Exception:
+                try:
+                    from dialogs import BasicDialogs
+                    self._dialogs = BasicDialogs(self.root)
+                except Exception:
+                    self._dialogs = None
+        return self._dialogs
+
     # ----------------- Actor management -----------------
     def add_actor_dialog(self):
         """Add an actor to the active document (or prompt harmlessly if none)."""
@@ -394,11 +545,32 @@ class DiagramApp:
             pass
 
     # ----------------- Persistence (save/load) -----------------
+    # Accelerator handlers; 'break' keeps the key from reaching the focused widget
+    def _acc_save(self, event=None):
+        self.save()
+        return 'break'
+
+    def _acc_open(self, event=None):
+        self.load_diagram_dialog()
+        return 'break'
+
+    def _acc_new(self, event=None):
+        self.new_diagram()
+        return 'break'
+
+    def _acc_save_as(self, event=None):
+        self.save_diagram_dialog()
+        return 'break'
+
     def new_diagram(self):
         # Create a new tab/document and select it
-        doc = Document(self, title='Untitled')
+        self._add_document(Document(self, title='Untitled'))
+
+    def _add_document(self, doc: Document):
+        """Build `doc`'s widgets in a new notebook page and select it."""
         frame = doc.create_ui(self.notebook)
         self.documents.append(doc)
+        self._tab_to_doc[str(frame)] = doc
         self.notebook.add(frame, text=doc.title)
         self.notebook.select(frame)
         self.active_document = doc
@@ -423,6 +595,7 @@ class DiagramApp:
         doc = getattr(self, 'active_document', None)
         if not doc:
             return False
+        from tkinter import filedialog  # imported on first use to keep startup light
         f = filedialog.asksaveasfilename(parent=self.root, defaultextension='.json', filetypes=[('Diagram JSON', '*.json')])
         if not f:
             return False
@@ -431,8 +604,8 @@ class DiagramApp:
             doc.current_file = Path(f)
             # update tab title
             try:
-                idx = self.notebook.index(doc.frame)
-                self.notebook.tab(idx, text=Path(f).name)
+                # the page widget itself identifies the tab
+                self.notebook.tab(doc.frame, text=Path(f).name)
             except Exception:
                 pass
             return True
@@ -451,26 +624,45 @@ class DiagramApp:
         raise RuntimeError('No active document')
 
     def load_diagram_dialog(self):
+        from tkinter import filedialog  # imported on first use to keep startup light
         f = filedialog.askopenfilename(parent=self.root, defaultextension='.json', filetypes=[('Diagram JSON', '*.json')])
         if not f:
             return False
         try:
             # Create a new document and load into it
             doc = Document(self, title=Path(f).name)
-            frame = doc.create_ui(self.notebook)
-            self.documents.append(doc)
-            self.notebook.add(frame, text=doc.title)
-            self.notebook.select(frame)
-            self.active_document = doc
-            doc.load_diagram(f)
-            doc.current_file = Path(f)
-            return True
+            self._add_document(doc)
         except Exception as e:
             try:
                 self.dialogs.error('Load error', str(e))
             except Exception:
                 pass
             return False
+        # read and parse off the UI thread; the model is swapped in by _apply_loaded
+        threading.Thread(target=self._bg_load, args=(f, doc), daemon=True).start()
+        return True
+
+    def _bg_load(self, path: str, doc: Document):
+        # worker thread: no Tk calls except handing the result back via after()
+        try:
+            with open(path, 'rb') as fh:
+                result = _parse_diagram_bytes(fh.read())
+        except Exception as e:
+            result = e
+        try:
+            self.root.after(0, self._apply_loaded, doc, path, result)
+        except Exception:
+            pass
+
+    def _apply_loaded(self, doc: Document, path: str, result):
+        if isinstance(result, Exception):
+            try:
+                self.dialogs.error('Load error', str(result))
+            except Exception:
+                pass
+            return
+        doc.set_diagram(*result)
+        doc.current_file = Path(path)
 
     def load_diagram(self, path: str):
         # Deprecated: prefer load via load_diagram_dialog which creates a new document
@@ -547,64 +739,89 @@ class DiagramApp:
     def save_preferences(self):
         prefs.save_preferences(self.config)
 
-    def apply_theme(self, theme_name: str):
-        """Apply either 'light' or 'dark' palette to the app chrome and widgets."""
-        palette = palette_for_theme(theme_name)
-        self.palette = palette
+    def save_preferences_deferred(self):
+        """Write preferences ~500ms from now; further calls within that window restart the timer."""
+        if self._prefs_save_after:
+            try:
+                self.root.after_cancel(self._prefs_save_after)
+            except Exception:
+                pass
+        self._prefs_save_after = self.root.after(500, self._do_save_prefs)
 
-        # apply root bg
+    def _do_save_prefs(self):
+        self._prefs_save_after = None
+        # e.g. toggling dark -> light -> dark within the debounce window writes nothing
+        snapshot = json.dumps(self.config, sort_keys=True)
+        if snapshot == self._last_saved_prefs:
+            return
         try:
-            self.root.configure(background=palette['app_bg'])
+            self.save_preferences()
+            self._last_saved_prefs = snapshot
         except Exception:
             pass
 
-        # apply ttk styles
-        try:
-            self.style.configure('TFrame', background=palette['app_bg'])
-            self.style.configure('Card.TFrame', background=palette['card_bg'])
-            self.style.configure('Card.TLabel', background=palette['card_bg'], font=self.small_font, foreground=palette['text_fg'])
-            self.style.configure('TLabel', background=palette['app_bg'], font=self.small_font, foreground=palette['text_fg'])
-            self.style.configure('Header.TLabel', background=palette['app_bg'], font=self.header_font, foreground=palette['text_fg'])
-            # Accent button: normal/active should use accent background with white text; disabled should use card background and muted text
+    def _on_close(self):
+        # flush a deferred preferences write before the window goes away
+        if self._prefs_save_after:
             try:
-                self.style.configure('Accent.TButton', foreground='white', background=palette['accent'], font=self.small_font)
-                self.style.map('Accent.TButton',
-                               background=[('disabled', palette.get('card_bg')), ('active', palette.get('accent')), ('!disabled', palette.get('accent'))],
-                               foreground=[('disabled', palette.get('muted_fg')), ('!disabled', 'white')])
+                self.root.after_cancel(self._prefs_save_after)
             except Exception:
-                # Some ttk themes may not accept direct color maps; ignore failures.
                 pass
+            self._do_save_prefs()
+        # a running export still finishes writing its file; just don't queue more
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False)
+        self.root.destroy()
+
+    def apply_theme(self, theme_name: str, initial: bool = False):
+        """Apply either 'light' or 'dark' palette to the app chrome and widgets.
+
+        `initial` is set for the call from __init__: no documents exist yet, so only the
+        palette and the app-level styles are applied. Documents created later pick the
+        palette up themselves.
+        """
+        # palette_for_theme falls back to light for anything but 'dark'
+        effective = 'dark' if (theme_name or '').lower() == 'dark' else 'light'
+        if getattr(self, 'current_theme', None) == effective:
+            return
+        self.current_theme = effective
+        palette = palette_for_theme(theme_name)
+        self.palette = palette
+        # shared by every document's apply_palette
+        self.menu_conf = option_menu_conf(palette)
+        card = palette['card_bg']
+        accent = palette['accent']
+
+        # apply root bg
+        safe_configure(self.root, background=palette['app_bg'])
 
+        # apply ttk styles, skipping the ones whose options didn't change since the last apply
+        for name, build in STYLE_TABLE:
+            kw = build(self, palette)
+            if self._applied_styles.get(name) == kw:
+                continue
             try:
-                self.style.configure('Card.TCombobox', fieldbackground=palette['card_bg'], background=palette['card_bg'], foreground=palette['text_fg'])
+                self.style.configure(name, **kw)
+                self._applied_styles[name] = kw
             except Exception:
                 pass
-        except Exception:
-            pass
-
-        # update existing widgets that use tk colors (OptionMenus etc.)
-        try:
-            # style the new-interaction OptionMenu
+        # Accent button: normal/active should use accent background with white text; disabled should use card background and muted text
+        accent_map = {
+            'background': [('disabled', card), ('active', accent), ('!disabled', accent)],
+            'foreground': [('disabled', palette.get('muted_fg')), ('!disabled', 'white')],
+        }
+        if accent_map != self._applied_accent_map:
             try:
-                self._new_interaction_style_menu.configure(bg=palette['card_bg'], fg=palette.get('text_fg'), activebackground=palette['card_bg'], highlightthickness=0)
-                self._new_interaction_style_menu['menu'].configure(bg=palette['card_bg'], fg=palette.get('text_fg'), activebackground=palette['accent'])
+                self.style.map('Accent.TButton', **accent_map)
+                self._applied_accent_map = accent_map
             except Exception:
+                # Some ttk themes may not accept direct color maps; ignore failures.
                 pass
-        except Exception:
-            pass
 
-        try:
-            # style the per-interaction OptionMenu (dropdown used to pick line type for selected interaction)
-            if hasattr(self, 'style_menu') and self.style_menu is not None:
-                try:
-                    self.style_menu.configure(bg=palette['card_bg'], fg=palette['text_fg'], activebackground=palette['card_bg'], highlightthickness=0)
-                    self.style_menu['menu'].configure(bg=palette['card_bg'], fg=palette['text_fg'], activebackground=palette['accent'])
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if initial:
+            return
 
-        # propagate palette to all open documents (their widgets & canvases)
+        # propagate palette to all open documents (their widgets, OptionMenus & canvases)
         try:
             for doc in getattr(self, 'documents', []):
                 try:
@@ -614,15 +831,6 @@ class DiagramApp:
         except Exception:
             pass
 
-        # re-draw to apply color changes
-        try:
-            # redraw active document
-            doc = self.get_active_document()
-            if doc and getattr(doc, 'canvas_controller', None):
-                doc.canvas_controller.redraw()
-        except Exception:
-            pass
-
         return
 
     def on_theme_combo_change(self, val=None):
@@ -642,12 +850,15 @@ class DiagramApp:
         else:
             key = 'light'
 
-        self.user_theme_pref = key
-        try:
-            self.config['theme'] = self.user_theme_pref
-            self.save_preferences()
-        except Exception:
-            pass
+        # re-picking the current choice doesn't touch the prefs file; apply_theme below
+        # is then a no-op too unless the system theme changed since it was last applied
+        if key != self.user_theme_pref:
+            self.user_theme_pref = key
+            try:
+                self.config['theme'] = self.user_theme_pref
+                self.save_preferences_deferred()
+            except Exception:
+                pass
 
         eff = self.user_theme_pref
         if eff == 'system':
@@ -655,32 +866,74 @@ class DiagramApp:
         self.apply_theme(eff)
 
     def export_dialog(self):
-        """Open export modal; choose PNG/JPEG and optional transparency for PNG."""
+        """Open export modal; choose PNG/JPEG and optional transparency for PNG.
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Export options")
-        dlg.transient(self.root)
+        The dialog is built on first use and then hidden/shown; it is rebuilt only if
+        it was destroyed or the theme palette changed since it was built. A reused
+        dialog starts from the default options again.
+        """
+        dlg = getattr(self, '_export_dlg', None)
+        try:
+            reuse = dlg is not None and dlg.winfo_exists() and self._export_dlg_palette is self.palette
+        except Exception:
+            reuse = False
+        if not reuse:
+            if dlg is not None:
+                try:
+                    dlg.destroy()
+                except Exception:
+                    pass
+            dlg = self._build_export_dialog()
+        else:
+            self._export_fmt_var.set('png')
+            self._export_trans_var.set(1)
+        dlg.deiconify()
         dlg.grab_set()
         try:
             center_window(dlg, self.root)
         except Exception:
             pass
 
+    def _build_export_dialog(self):
+        dlg = tk.Toplevel(self.root)
+        dlg.withdraw()
+        dlg.title("Export options")
+        dlg.transient(self.root)
+        self._export_dlg = dlg
+        self._export_dlg_palette = self.palette
+
+        def hide():
+            try:
+                dlg.grab_release()
+                dlg.withdraw()
+            except Exception:
+                pass
+
+        # closing only hides the dialog so the next export can reuse it
+        dlg.protocol('WM_DELETE_WINDOW', hide)
+        dlg.bind('<Escape>', lambda e: hide())
+
+        # palette colours shared by the radio buttons and the checkbox
+        card_bg = self.palette.get('card_bg', '#ffffff')
+        text_fg = self.palette.get('text_fg')
+        rb_kw = dict(bd=0, highlightthickness=0, bg=card_bg, activebackground=card_bg, fg=text_fg,
+                     selectcolor=self.palette.get('accent'), activeforeground=text_fg)
+
         card = ttk.Frame(dlg, style='Card.TFrame')
         card.pack(padx=12, pady=12, fill=tk.BOTH, expand=True)
         ttk.Label(card, text="Export options", style='Header.TLabel').pack(anchor=tk.W, padx=8, pady=(6,4))
 
-        fmt_var = tk.StringVar(value='png')
+        fmt_var = self._export_fmt_var = tk.StringVar(value='png')
         fmt_row = ttk.Frame(card, style='Card.TFrame')
         fmt_row.pack(fill=tk.X, padx=8, pady=(4,2))
-        tk.Label(fmt_row, text="Format:", bg=self.palette.get('card_bg', '#ffffff'), font=self.small_font).grid(row=0, column=0, sticky=tk.W)
-        rpng = tk.Radiobutton(fmt_row, text='PNG', variable=fmt_var, value='png', bd=0, highlightthickness=0, bg=self.palette.get('card_bg'), activebackground=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), selectcolor=self.palette.get('accent'), activeforeground=self.palette.get('text_fg'))
+        tk.Label(fmt_row, text="Format:", bg=card_bg, font=self.small_font).grid(row=0, column=0, sticky=tk.W)
+        rpng = tk.Radiobutton(fmt_row, text='PNG', variable=fmt_var, value='png', **rb_kw)
         rpng.grid(row=0, column=1, padx=8)
-        rjpg = tk.Radiobutton(fmt_row, text='JPEG', variable=fmt_var, value='jpg', bd=0, highlightthickness=0, bg=self.palette.get('card_bg'), activebackground=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), selectcolor=self.palette.get('accent'), activeforeground=self.palette.get('text_fg'))
+        rjpg = tk.Radiobutton(fmt_row, text='JPEG', variable=fmt_var, value='jpg', **rb_kw)
         rjpg.grid(row=0, column=2, padx=8)
 
-        trans_var = tk.IntVar(value=1)
-        trans_cb = tk.Checkbutton(card, text='Transparent background (PNG)', variable=trans_var, bd=0, highlightthickness=0, bg=self.palette.get('card_bg'), activebackground=self.palette.get('card_bg'), fg=self.palette.get('text_fg'), selectcolor=self.palette.get('accent'), activeforeground=self.palette.get('text_fg'))
+        trans_var = self._export_trans_var = tk.IntVar(value=1)
+        trans_cb = tk.Checkbutton(card, text='Transparent background (PNG)', variable=trans_var, **rb_kw)
         try:
             trans_cb.config(font=self.small_font)
         except Exception:
@@ -705,15 +958,14 @@ class DiagramApp:
         btns.pack(fill=tk.X, padx=8, pady=(8,4))
 
         def choose_and_export():
+            # file dialogs are only loaded once the user exports
+            from tkinter import filedialog
             ftypes = [("PNG", "*.png"), ("JPEG", "*.jpg;*.jpeg")]
             default_ext = '.png' if fmt_var.get() == 'png' else '.jpg'
             out_path = filedialog.asksaveasfilename(parent=dlg, defaultextension=default_ext, filetypes=ftypes)
             if not out_path:
                 return
-            try:
-                dlg.destroy()
-            except Exception:
-                pass
+            hide()
             # If an Export button exists in the UI it would be disabled while exporting;
             # but the button was removed in favor of the context menu. Guard the reference.
             try:
@@ -721,35 +973,85 @@ class DiagramApp:
                     self.export_btn.config(state='disabled')
             except Exception:
                 pass
-            try:
-                try:
-                    # Prefer active document's canvas
-                    doc = self.get_active_document()
-                    canvas = None
-                    if doc and getattr(doc, 'canvas', None):
-                        canvas = doc.canvas
-                    # If no document canvas available, error out
-                    if canvas is None:
-                        raise RuntimeError('No open document to export')
-                    export_canvas(canvas, self.root, out_path, transparent=bool(trans_var.get()))
-                    self.dialogs.info("Export", f"Exported to {out_path}")
-                except Exception as e:
-                    try:
-                        self.dialogs.error("Export error", str(e))
-                    except Exception:
-                        pass
-            finally:
-                try:
-                    if hasattr(self, 'export_btn'):
-                        self.export_btn.config(state='normal')
-                except Exception:
-                    pass
+            # Prefer active document's canvas
+            doc = self.get_active_document()
+            canvas = None
+            if doc and getattr(doc, 'canvas', None):
+                canvas = doc.canvas
+            # If no document canvas available, error out
+            if canvas is None:
+                self._finish_export(RuntimeError('No open document to export'))
+                return
+            self._start_export(canvas, out_path, bool(trans_var.get()))
 
         ttk.Button(btns, text='Choose file & Export', command=choose_and_export, style='Accent.TButton').pack(side=tk.RIGHT, padx=6)
-        ttk.Button(btns, text='Cancel', command=lambda: dlg.destroy(), style='Accent.TButton').pack(side=tk.RIGHT, padx=6)
+        ttk.Button(btns, text='Cancel', command=hide, style='Accent.TButton').pack(side=tk.RIGHT, padx=6)
 
         on_fmt_change()
-        dlg.wait_window()
+        return dlg
+
+    def _start_export(self, canvas, out_path: str, transparent: bool, use_grab: bool = False, ps_exc=None):
+        """Snapshot `canvas` here and rasterize/encode/write it on the export worker thread.
+
+        Tk calls (postscript, screen grab) must stay on this thread; the Pillow work is
+        what takes long. A failed PostScript render is retried once via ImageGrab.
+        """
+        from export_utils import capture_canvas, render_capture
+        try:
+            cap = capture_canvas(canvas, self.root, use_grab=use_grab)
+        except Exception as e:
+            self._export_failed(canvas, out_path, transparent, use_grab, ps_exc, e)
+            return
+        # without Ghostscript capture_canvas grabs the screen anyway; a failure then isn't a PostScript one
+        use_grab = use_grab or cap.ps_path is None
+        if self._export_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='export')
+        fut = self._export_pool.submit(render_capture, cap, out_path, transparent)
+
+        def done(f):
+            # runs on the worker thread; hand the result back to the Tk thread
+            try:
+                self.root.after(0, self._on_export_done, f, canvas, out_path, transparent, use_grab, ps_exc)
+            except Exception:
+                pass
+        fut.add_done_callback(done)
+
+    def _on_export_done(self, fut, canvas, out_path: str, transparent: bool, use_grab: bool, ps_exc):
+        exc = fut.exception()
+        if exc is None:
+            self._finish_export()
+            try:
+                self.dialogs.info("Export", f"Exported to {out_path}")
+            except Exception:
+                pass
+        else:
+            self._export_failed(canvas, out_path, transparent, use_grab, ps_exc, exc)
+
+    def _export_failed(self, canvas, out_path: str, transparent: bool, use_grab: bool, ps_exc, exc):
+        from export_utils import ImageGrab, export_error_message
+        if not use_grab and ImageGrab is not None:
+            # PostScript route failed: fall back to grabbing the canvas from the screen
+            try:
+                if canvas.winfo_exists():
+                    self._start_export(canvas, out_path, transparent, use_grab=True, ps_exc=exc)
+                    return
+            except Exception:
+                pass
+        self._finish_export(RuntimeError(export_error_message((ps_exc, exc) if ps_exc is not None else exc)))
+
+    def _finish_export(self, error: Optional[Exception] = None):
+        # If an Export button exists in the UI it was disabled while exporting; guard the reference.
+        try:
+            if hasattr(self, 'export_btn'):
+                self.export_btn.config(state='normal')
+        except Exception:
+            pass
+        if error is not None:
+            try:
+                self.dialogs.error("Export error", str(error))
+            except Exception:
+                pass
 
     def show_canvas_context_menu(self, event, doc: Optional[Document] = None):
         """Show a right-click context menu on the canvas with common actions.
@@ -757,14 +1059,16 @@ class DiagramApp:
         The menu provides 'Add Actor' and 'Export...' entries. We post the menu at
         the pointer location so it feels native.
         """
-        # Create a menu and keep a transient reference so it's not GC'd while shown.
-        menu = None
+        # The menu is built on first use and reused; 'Add Actor' targets the document
+        # that was right-clicked last (see _ctx_add_actor).
+        self._ctx_doc = doc
+        menu = self._ctx_menu
         try:
-            menu = tk.Menu(self.root, tearoff=0)
-            menu.add_command(label='Add Actor', command=lambda: (doc.add_actor_dialog() if doc else None))
-            menu.add_separator()
-            menu.add_command(label='Export...', command=lambda: self.export_dialog())
-            self._context_menu = menu
+            if menu is None:
+                menu = self._ctx_menu = tk.Menu(self.root, tearoff=0)
+                menu.add_command(label='Add Actor', command=self._ctx_add_actor)
+                menu.add_separator()
+                menu.add_command(label='Export...', command=self.export_dialog)
             # Determine screen coords for the popup. Some event objects (from root.bind_all)
             # may not provide x_root/y_root reliably, so fall back to the current pointer.
             try:
@@ -787,19 +1091,20 @@ class DiagramApp:
                     menu.grab_release()
             except Exception:
                 pass
-            try:
-                self._context_menu = None
-            except Exception:
-                pass
+
+    def _ctx_add_actor(self):
+        doc = self._ctx_doc
+        if doc is not None:
+            doc.add_actor_dialog()
 
     def _on_tab_changed(self, event):
         try:
             sel = event.widget.select()
-            # find document with matching frame
-            for doc in self.documents:
-                if str(doc.frame) == sel:
-                    self.active_document = doc
-                    return
+            # find document with matching page
+            doc = self._tab_to_doc.get(str(sel))
+            if doc is not None:
+                self.active_document = doc
+                return
             # fallback: if index returned, map by index
             try:
                 idx = event.widget.index(sel)
@@ -822,8 +1127,8 @@ class DiagramApp:
 
     def get_actor_by_id(self, id_: int) -> Optional[Actor]:
         doc = self.get_active_document()
-        if doc and doc.canvas_controller:
-            return doc.canvas_controller.get_actor_by_id(id_)
+        if doc:
+            return doc.get_actor_by_id(id_)
         return None
 
     def redraw(self):
@@ -831,3 +1136,8 @@ class DiagramApp:
         if doc and doc.canvas_controller:
             return doc.canvas_controller.redraw()
         return None
+
+    def schedule_redraw(self):
+        doc = self.get_active_document()
+        if doc:
+            doc.schedule_redraw()
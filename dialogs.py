@@ -14,6 +14,11 @@ class ThemedDialogs:
     """
     def __init__(self, app):
         self.app = app
+        # info/error reuse one hidden dialog; see _info_dialog
+        self._info_dlg = None
+        self._info_parts = None
+        self._info_key = None
+        self._info_busy = False
 
     def ask_string(self, title: str, prompt: str, initial: str = "", parent=None) -> Optional[str]:
         parent = parent or self.app.root
@@ -76,27 +81,78 @@ class ThemedDialogs:
         dlg.wait_window()
         return result['value']
 
-    def info(self, title: str, message: str, parent=None):
-        parent = parent or self.app.root
+    def _build_info_dialog(self, parent):
+        """Build a hidden message dialog; returns (dlg, label, done_var)."""
         dlg = tk.Toplevel(parent)
-        dlg.title(title)
+        dlg.withdraw()
         dlg.transient(parent)
-        dlg.grab_set()
-        try:
-            center_window(dlg, parent)
-        except Exception:
-            pass
         try:
             dlg.configure(background=self.app.palette.get('app_bg'))
         except Exception:
             pass
+        done = tk.IntVar(dlg, value=0)
+        close = lambda *_: done.set(1)
         card = ttk.Frame(dlg, style='Card.TFrame')
         card.pack(padx=12, pady=12, fill=tk.BOTH, expand=True)
-        ttk.Label(card, text=message, style='Card.TLabel', wraplength=400).pack(anchor=tk.W, padx=8, pady=(6,8))
+        label = ttk.Label(card, style='Card.TLabel', wraplength=400)
+        label.pack(anchor=tk.W, padx=8, pady=(6,8))
         btns = ttk.Frame(card, style='Card.TFrame')
         btns.pack(fill=tk.X, padx=8, pady=(6,4))
-        ttk.Button(btns, text='OK', command=dlg.destroy, style='Accent.TButton').pack(side=tk.RIGHT, padx=6)
-        dlg.wait_window()
+        ttk.Button(btns, text='OK', command=close, style='Accent.TButton').pack(side=tk.RIGHT, padx=6)
+        dlg.protocol('WM_DELETE_WINDOW', close)
+        dlg.bind('<Escape>', close)
+        # never leave a caller waiting on a dialog that was destroyed
+        dlg.bind('<Destroy>', lambda e: close() if e.widget is dlg else None)
+        return dlg, label, done
+
+    def _info_dialog(self, parent):
+        """The cached message dialog, rebuilt if it was destroyed or the parent/palette changed."""
+        key = (parent, self.app.palette)
+        dlg = self._info_dlg
+        try:
+            reuse = dlg is not None and dlg.winfo_exists() and self._info_key[0] is key[0] and self._info_key[1] is key[1]
+        except Exception:
+            reuse = False
+        if not reuse:
+            if dlg is not None:
+                try:
+                    dlg.destroy()
+                except Exception:
+                    pass
+            self._info_parts = self._build_info_dialog(parent)
+            self._info_dlg = self._info_parts[0]
+            self._info_key = key
+        return self._info_parts
+
+    def info(self, title: str, message: str, parent=None):
+        parent = parent or self.app.root
+        # a message shown while the cached dialog is open gets a one-off dialog
+        cached = not self._info_busy
+        dlg, label, done = self._info_dialog(parent) if cached else self._build_info_dialog(parent)
+        dlg.title(title)
+        label.configure(text=message)
+        done.set(0)
+        dlg.deiconify()
+        dlg.grab_set()
+        try:
+            center_window(dlg, parent)
+        except Exception:
+            pass
+        if cached:
+            self._info_busy = True
+        try:
+            dlg.wait_variable(done)
+        finally:
+            if cached:
+                self._info_busy = False
+            try:
+                dlg.grab_release()
+                if cached:
+                    dlg.withdraw()
+                else:
+                    dlg.destroy()
+            except Exception:
+                pass
 
     def error(self, title: str, message: str, parent=None):
         # For now error uses same visual as info
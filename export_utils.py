@@ -1,18 +1,24 @@
 import tempfile
 import os
 import shutil
+from dataclasses import dataclass
 from typing import Optional, Tuple
 
 try:
-    from PIL import Image, ImageGrab
+    from PIL import Image, ImageChops, ImageGrab
 except Exception:
     try:
-        from PIL import Image
+        from PIL import Image, ImageChops
         ImageGrab = None
     except Exception:
         Image = None
         ImageGrab = None
 
+try:
+    import numpy as np  # optional, speeds up chroma keying on large exports
+except Exception:
+    np = None
+
 
 def find_ghostscript() -> Optional[str]:
     """Return path to ghostscript executable if found, else None."""
@@ -25,10 +31,11 @@ def find_ghostscript() -> Optional[str]:
 
 
 def postscript_to_image(ps_path: str) -> 'Image.Image':
-    """Open a PostScript file via Pillow. Raises if Pillow not available or open fails."""
+    """Open and rasterize a PostScript file via Pillow. Raises if Pillow not available or open fails."""
     if Image is None:
         raise RuntimeError('Pillow (PIL) is required')
     img = Image.open(ps_path)
+    img.load()
     return img
 
 
@@ -37,15 +44,17 @@ def chroma_key_transparent(img, bg_rgb: Tuple[int,int,int], tol: int = 10):
     if Image is None:
         raise RuntimeError('Pillow (PIL) is required')
     img = img.convert('RGBA')
-    datas = img.getdata()
-    newData = []
-    for item in datas:
-        r, g, b, a = item
-        if (abs(r - bg_rgb[0]) <= tol and abs(g - bg_rgb[1]) <= tol and abs(b - bg_rgb[2]) <= tol):
-            newData.append((r, g, b, 0))
-        else:
-            newData.append((r, g, b, a))
-    img.putdata(newData)
+    if np is not None:
+        arr = np.array(img, dtype=np.uint8)
+        diff = np.abs(arr[..., :3].astype(np.int16) - np.array(bg_rgb, dtype=np.int16))
+        arr[(diff <= tol).all(axis=-1), 3] = 0
+        return Image.fromarray(arr, 'RGBA')
+    # per-band distance from bg, thresholded and OR-ed: 255 where any band is off by more than tol
+    diff = ImageChops.difference(img.convert('RGB'), Image.new('RGB', img.size, tuple(bg_rgb)))
+    lut = [0 if v <= tol else 255 for v in range(256)]
+    r, g, b = (band.point(lut) for band in diff.split())
+    keep = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    img.putalpha(ImageChops.darker(img.getchannel('A'), keep))
     return img
 
 
@@ -56,86 +65,128 @@ def save_image(img, out_path: str):
     return out_path
 
 
+_BG_RGB_CACHE = {}
+
+
+def _resolve_bg(root, bg: str) -> Tuple[int, int, int]:
+    """8-bit RGB for a Tk colour name; winfo_rgb is a Tcl round trip, so results are kept per (root, bg)."""
+    key = (id(root), bg)
+    rgb = _BG_RGB_CACHE.get(key)
+    if rgb is None:
+        r16, g16, b16 = root.winfo_rgb(bg)
+        rgb = (r16 // 256, g16 // 256, b16 // 256)
+        if len(_BG_RGB_CACHE) >= 64:
+            _BG_RGB_CACHE.clear()
+        _BG_RGB_CACHE[key] = rgb
+    return rgb
+
+
+@dataclass
+class CanvasCapture:
+    """What capture_canvas took from the canvas: a temporary PostScript file or a screen grab."""
+    ps_path: Optional[str] = None
+    image: Optional['Image.Image'] = None
+    bg_rgb: Tuple[int, int, int] = (255, 255, 255)
+
+
+def _check_export_backends():
+    if find_ghostscript() is None and ImageGrab is None:
+        raise RuntimeError("PostScript export requires Ghostscript and Pillow. Ghostscript not found and ImageGrab fallback is not available.")
+
+
+def capture_canvas(canvas, root, use_grab: bool = False) -> CanvasCapture:
+    """Snapshot the canvas for export. Must run on the Tk thread.
+
+    Writes the canvas to a temporary PostScript file, or grabs its screen area when
+    `use_grab` is set or Ghostscript is missing. The result is turned into an image
+    file by render_capture, which doesn't touch Tk.
+    """
+    _check_export_backends()
+    canvas.update()
+    cap = CanvasCapture()
+    try:
+        cap.bg_rgb = _resolve_bg(root, canvas.cget('bg'))
+    except Exception:
+        pass
+    if use_grab or find_ghostscript() is None:
+        if ImageGrab is None:
+            raise RuntimeError("ImageGrab fallback is not available")
+        x = canvas.winfo_rootx()
+        y = canvas.winfo_rooty()
+        cap.image = ImageGrab.grab((x, y, x + canvas.winfo_width(), y + canvas.winfo_height()))
+        return cap
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.ps') as tmp:
+        cap.ps_path = tmp.name
+    try:
+        canvas.postscript(file=cap.ps_path, colormode='color')
+    except Exception:
+        discard_capture(cap)
+        raise
+    return cap
+
+
+def discard_capture(cap: CanvasCapture):
+    """Remove the temporary file of a capture, if any."""
+    try:
+        if cap.ps_path and os.path.exists(cap.ps_path):
+            os.remove(cap.ps_path)
+    except Exception:
+        pass
+
+
+def render_capture(cap: CanvasCapture, out_path: str, transparent: bool = False) -> str:
+    """Rasterize, convert and save a capture to out_path. Safe to call off the Tk thread."""
+    try:
+        img = cap.image if cap.image is not None else postscript_to_image(cap.ps_path)
+        if out_path.lower().endswith(('.jpg', '.jpeg')):
+            img = img.convert('RGB')
+        else:
+            img = img.convert('RGBA')
+
+        if out_path.lower().endswith('.png') and transparent:
+            img = chroma_key_transparent(img, cap.bg_rgb)
+
+        save_image(img, out_path)
+        return out_path
+    finally:
+        discard_capture(cap)
+
+
+def export_error_message(last_exc) -> str:
+    """Format the error of a failed export; `last_exc` is an exception or a (PostScript, ImageGrab) pair."""
+    msg = "Export failed."
+    if isinstance(last_exc, tuple):
+        msg += f"\nPostScript error: {last_exc[0]}\nImageGrab error: {last_exc[1]}"
+    else:
+        msg += f"\nError: {last_exc}"
+    return msg
+
+
 def export_canvas(canvas, root, out_path: str, transparent: bool = False) -> str:
     """Export a Tkinter canvas to out_path. Raises RuntimeError on failure.
 
     Tries PostScript -> Pillow (requires Ghostscript for correct colors) first,
-    then falls back to ImageGrab if available.
+    then falls back to ImageGrab if available. Runs entirely on the calling thread;
+    the app splits it into capture_canvas and render_capture instead.
     """
-    gs_path = find_ghostscript()
-    if gs_path is None and ImageGrab is None:
-        raise RuntimeError("PostScript export requires Ghostscript and Pillow. Ghostscript not found and ImageGrab fallback is not available.")
+    _check_export_backends()
 
-    ps_path = None
     last_exc = None
     try:
         # PostScript route
         try:
-            canvas.update()
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.ps') as tmp:
-                ps_path = tmp.name
-            canvas.postscript(file=ps_path, colormode='color')
-            img = postscript_to_image(ps_path)
-            if out_path.lower().endswith(('.jpg', '.jpeg')):
-                img = img.convert('RGB')
-            else:
-                img = img.convert('RGBA')
-
-            if out_path.lower().endswith('.png') and transparent:
-                try:
-                    bg = canvas.cget('bg')
-                    r16, g16, b16 = root.winfo_rgb(bg)
-                    bg_rgb = (r16 // 256, g16 // 256, b16 // 256)
-                except Exception:
-                    bg_rgb = (255, 255, 255)
-                img = chroma_key_transparent(img, bg_rgb)
-
-            save_image(img, out_path)
-            return out_path
+            return render_capture(capture_canvas(canvas, root), out_path, transparent)
         except Exception as e:
             last_exc = e
 
         # ImageGrab fallback
         if ImageGrab is not None:
             try:
-                canvas.update()
-                x = canvas.winfo_rootx()
-                y = canvas.winfo_rooty()
-                w = canvas.winfo_width()
-                h = canvas.winfo_height()
-                bbox = (x, y, x + w, y + h)
-                img = ImageGrab.grab(bbox)
-                if out_path.lower().endswith(('.jpg', '.jpeg')):
-                    img = img.convert('RGB')
-                else:
-                    img = img.convert('RGBA')
-
-                if out_path.lower().endswith('.png') and transparent:
-                    try:
-                        bg = canvas.cget('bg')
-                        r16, g16, b16 = root.winfo_rgb(bg)
-                        bg_rgb = (r16 // 256, g16 // 256, b16 // 256)
-                    except Exception:
-                        bg_rgb = (255, 255, 255)
-                    img = chroma_key_transparent(img, bg_rgb)
-
-                save_image(img, out_path)
-                return out_path
+                return render_capture(capture_canvas(canvas, root, use_grab=True), out_path, transparent)
             except Exception as e2:
                 last_exc = (last_exc, e2)
                 raise
 
         raise RuntimeError("PostScript export failed and ImageGrab fallback is not available")
     except Exception as final_exc:
-        msg = "Export failed."
-        if isinstance(last_exc, tuple):
-            msg += f"\nPostScript error: {last_exc[0]}\nImageGrab error: {last_exc[1]}"
-        else:
-            msg += f"\nError: {last_exc or final_exc}"
-        raise RuntimeError(msg)
-    finally:
-        try:
-            if ps_path and os.path.exists(ps_path):
-                os.remove(ps_path)
-        except Exception:
-            pass
+        raise RuntimeError(export_error_message(last_exc or final_exc))
@@ -4,12 +4,18 @@ This module is a thin wrapper that manipulates the `app.interactions` list and u
 UI widgets owned by the app.
 """
 import tkinter as tk
+from typing import Optional
+
+# at most this many changed rows are patched in place; beyond that the whole list is replaced
+_ROW_PATCH_LIMIT = 8
 
 
 class InteractionManager:
     def __init__(self, app):
         self.app = app
         self.listbox = app.interaction_listbox
+        # what the listbox rows were last built from; None forces the next rebuild
+        self._last_sig = None
 
     def update_interaction_listbox(self, selected_idx_override: int = None):
         """Rebuild the listbox contents.
@@ -31,25 +37,26 @@ class InteractionManager:
         else:
             target_idx = cur_idx
 
-        self.listbox.delete(0, tk.END)
-        for i, inter in enumerate(self.app.interactions):
-            src = self.app.get_actor_by_id(inter.source_id)
-            tgt = self.app.get_actor_by_id(inter.target_id)
-            src_name = src.name if src else f"id:{inter.source_id}"
-            tgt_name = tgt.name if tgt else f"id:{inter.target_id}"
-            s = f"{i+1}. {src_name} -> {tgt_name} [{inter.style}]: {inter.label}"
-            self.listbox.insert(tk.END, s)
+        names = {a.id: a.name for a in self.app.actors}
+        sig = (tuple((i.source_id, i.target_id, i.style, i.label) for i in self.app.interactions), tuple(names.items()))
+        rows = None
+        if sig != self._last_sig:
+            rows = tuple(self._row_text(i, inter, names) for i, inter in enumerate(self.app.interactions))
+        has_target = target_idx is not None and 0 <= target_idx < len(self.app.interactions)
+        if rows is not None:
+            self._sync_rows(rows)
+            self._last_sig = sig
+        # clear any previous selection and set the intended one exactly once
+        try:
+            self.listbox.select_clear(0, tk.END)
+            if has_target:
+                self.listbox.select_set(target_idx)
+        except Exception:
+            pass
 
-        # restore/establish selection if possible
-        if target_idx is not None and 0 <= target_idx < len(self.app.interactions):
+        if has_target:
+            # make sure dropdown & canvas reflect selection
             try:
-                # clear any previous selection and set the intended one exactly once
-                try:
-                    self.listbox.select_clear(0, tk.END)
-                except Exception:
-                    pass
-                self.listbox.select_set(target_idx)
-                # make sure dropdown & canvas reflect selection
                 self.on_interaction_select()
             except Exception:
                 pass
@@ -87,6 +94,52 @@ class InteractionManager:
             except Exception:
                 pass
 
+    def _schedule_redraw(self):
+        # the document collapses any number of these into one redraw per idle cycle
+        self.app.schedule_redraw()
+
+    def _sync_rows(self, rows):
+        """Make the listbox show `rows`, touching only the rows that differ when few do."""
+        try:
+            old = tuple(self.listbox.get(0, tk.END))
+        except Exception:
+            old = None
+        if old == rows:
+            return
+        if old is not None and len(old) == len(rows):
+            changed = [i for i, (a, b) in enumerate(zip(old, rows)) if a != b]
+            if len(changed) <= _ROW_PATCH_LIMIT:
+                for i in changed:
+                    self.listbox.delete(i)
+                    self.listbox.insert(i, rows[i])
+                return
+        list_var = getattr(self.app, 'interaction_list_var', None)
+        if list_var is not None:
+            # one Tk call replaces every row
+            list_var.set(rows)
+        else:
+            self.listbox.delete(0, tk.END)
+            self.listbox.insert(tk.END, *rows)
+
+    def _row_text(self, i: int, inter, names: Optional[dict] = None) -> str:
+        if names is None:
+            names = {a.id: a.name for a in map(self.app.get_actor_by_id, (inter.source_id, inter.target_id)) if a}
+        src_name = names.get(inter.source_id, f"id:{inter.source_id}")
+        tgt_name = names.get(inter.target_id, f"id:{inter.target_id}")
+        return f"{i+1}. {src_name} -> {tgt_name} [{inter.style}]: {inter.label}"
+
+    def append_interaction_row(self):
+        """Add a row for the last interaction without rebuilding the rest of the listbox.
+
+        Falls back to a full rebuild if the listbox is out of step with the model.
+        """
+        count = len(self.app.interactions)
+        if self.listbox.size() != count - 1:
+            self.update_interaction_listbox()
+            return
+        self._last_sig = None
+        self.listbox.insert(tk.END, self._row_text(count - 1, self.app.interactions[-1]))
+
     def select_interaction(self, idx: int):
         try:
             self.listbox.select_clear(0, tk.END)
@@ -115,9 +168,10 @@ class InteractionManager:
         if new_label is None:
             return
         inter.label = new_label
+        self.app.bump_scene_version()
         # keep the same item selected after update
         self.update_interaction_listbox(selected_idx_override=idx)
-        self.app.canvas_controller.redraw()
+        self._schedule_redraw()
 
     def on_interaction_select(self, event=None):
         sel = self.listbox.curselection()
@@ -152,14 +206,16 @@ class InteractionManager:
                 pass
             # redraw to clear any selection highlight
             try:
-                self.app.canvas_controller.redraw()
+                self._schedule_redraw()
             except Exception:
                 pass
             return
         idx = sel[0]
         # clear actor selection when an interaction is selected
         try:
-            self.app.selected_actor_id = None
+            if self.app.selected_actor_id is not None:
+                self.app.selected_actor_id = None
+                self.app.bump_scene_version()
         except Exception:
             pass
         inter = self.app.interactions[idx]
@@ -198,24 +254,27 @@ class InteractionManager:
             pass
         # redraw canvas so the selected interaction shows highlighted outline
         try:
-            self.app.canvas_controller.redraw()
+            self._schedule_redraw()
         except Exception:
             pass
 
-    def on_style_change(self):
+    def on_style_change(self, new_style: Optional[str] = None):
+        """Apply the picked style to the selected interaction; `new_style` defaults to style_var."""
         sel = self.listbox.curselection()
         if not sel:
             return
         idx = sel[0]
         if idx < 0 or idx >= len(self.app.interactions):
             return
-        new_style = self.app.style_var.get()
+        if new_style is None:
+            new_style = self.app.style_var.get()
         inter = self.app.interactions[idx]
         if inter.style != new_style:
             inter.style = new_style
+            self.app.bump_scene_version()
             # keep selection stable
             self.update_interaction_listbox(selected_idx_override=idx)
-            self.app.canvas_controller.redraw()
+            self._schedule_redraw()
 
     def move_interaction_up(self):
         sel = self.listbox.curselection()
@@ -225,9 +284,10 @@ class InteractionManager:
         if idx == 0:
             return
         self.app.interactions[idx-1], self.app.interactions[idx] = self.app.interactions[idx], self.app.interactions[idx-1]
+        self.app.bump_scene_version()
         # update list and select new (moved) index
         self.update_interaction_listbox(selected_idx_override=idx-1)
-        self.app.canvas_controller.redraw()
+        self._schedule_redraw()
 
     def move_interaction_down(self):
         sel = self.listbox.curselection()
@@ -237,9 +297,10 @@ class InteractionManager:
         if idx >= len(self.app.interactions)-1:
             return
         self.app.interactions[idx+1], self.app.interactions[idx] = self.app.interactions[idx], self.app.interactions[idx+1]
+        self.app.bump_scene_version()
         # update list and select new (moved) index
         self.update_interaction_listbox(selected_idx_override=idx+1)
-        self.app.canvas_controller.redraw()
+        self._schedule_redraw()
 
     def edit_interaction_label(self):
         sel = self.listbox.curselection()
@@ -251,9 +312,10 @@ class InteractionManager:
         if new_label is None:
             return
         inter.label = new_label
+        self.app.bump_scene_version()
         # keep same item selected
         self.update_interaction_listbox(selected_idx_override=idx)
-        self.app.canvas_controller.redraw()
+        self._schedule_redraw()
 
     def delete_interaction(self):
         sel = self.listbox.curselection()
@@ -261,6 +323,7 @@ class InteractionManager:
             return
         idx = sel[0]
         del self.app.interactions[idx]
+        self.app.bump_scene_version()
         # after deletion, select the next item if any, or the previous one
         new_sel = None
         if idx < len(self.app.interactions):
@@ -268,4 +331,4 @@ class InteractionManager:
         elif len(self.app.interactions) > 0:
             new_sel = len(self.app.interactions) - 1
         self.update_interaction_listbox(selected_idx_override=new_sel)
-        self.app.canvas_controller.redraw()
+        self._schedule_redraw()
@@ -1,6 +1,10 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# __slots__ on the model classes where dataclasses supports it (Python 3.10+)
+_MODEL_DATACLASS_OPTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Layout constants
 ACTOR_WIDTH = 120
 ACTOR_HEIGHT = 40
@@ -16,7 +20,7 @@ INDEX_COLOR = "#666666"
 ACTOR_TEXT_COLOR = "#111111"
 PREVIEW_LINE_COLOR = "#999999"
 
-@dataclass
+@dataclass(**_MODEL_DATACLASS_OPTS)
 class Actor:
     id: int
     name: str
@@ -24,11 +28,18 @@ class Actor:
     y: int = ACTOR_TOP_Y
     rect_id: Optional[int] = None
     text_id: Optional[int] = None
+    lifeline_id: Optional[int] = None
+    outline_id: Optional[int] = None  # selection highlight, only while selected
 
-@dataclass
+@dataclass(**_MODEL_DATACLASS_OPTS)
 class Interaction:
     source_id: int
     target_id: int
     label: str = ""
     style: str = "solid"  # 'solid' or 'dashed'
+    # canvas item ids from the last redraw (None when not drawn)
+    line_id: Optional[int] = None
+    outline_id: Optional[int] = None
+    label_id: Optional[int] = None
+    index_id: Optional[int] = None
 
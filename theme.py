@@ -1,8 +1,9 @@
 """Theme palettes and helper constants used by the app.
 
 This module centralizes the light and dark palettes used by the UI. Export a simple
-helper `palette_for_theme(name)` which returns a copy of the requested palette.
+helper `palette_for_theme(name)` which returns the (shared, read-only) requested palette.
 """
+from functools import lru_cache
 
 LIGHT_PALETTE = {
     'app_bg': '#f5f7fa',
@@ -39,14 +40,15 @@ DARK_PALETTE = {
 }
 
 
+@lru_cache(maxsize=None)
+def _palette(key: str):
+    return (DARK_PALETTE if key == 'dark' else LIGHT_PALETTE).copy()
+
+
 def palette_for_theme(name: str):
-    """Return a copy of the palette for the given theme name ('light' or 'dark').
+    """Return the palette for the given theme name ('light' or 'dark').
 
-    If `name` is falsy or not recognized, the light palette is returned.
+    If `name` is falsy or not recognized, the light palette is returned. The same dict
+    is returned for every call with the same theme, so callers must not modify it.
     """
-    if not name:
-        return LIGHT_PALETTE.copy()
-    n = name.lower()
-    if n == 'dark':
-        return DARK_PALETTE.copy()
-    return LIGHT_PALETTE.copy()
+    return _palette('dark' if name and name.lower() == 'dark' else 'light')
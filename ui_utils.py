@@ -1,11 +1,24 @@
-"""Small UI helpers for window placement.
+"""Small UI helpers for window placement and widget configuration.
 
 Provides center_window(window, parent) which positions a Toplevel or window
-centered over the parent window (or the screen if parent is None).
+centered over the parent window (or the screen if parent is None), and
+safe_configure(widget, **options) for best-effort option updates.
 """
+import tkinter as tk
 from typing import Optional
 
 
+def safe_configure(widget, **options):
+    """Configure `widget`, ignoring options the widget (or its Tk theme) rejects.
+
+    Only tk.TclError is swallowed; anything else is a real bug and propagates.
+    """
+    try:
+        widget.configure(**options)
+    except tk.TclError:
+        pass
+
+
 def center_window(win, parent: Optional[object] = None):
     """Center `win` (a tk.Toplevel or tk.Tk) over `parent`.
 